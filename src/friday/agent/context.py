@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -29,6 +31,18 @@ def _git(args: list[str], cwd: Path, fallback: str = '') -> str:
     return result.stdout.strip() or fallback
 
 
+def _read_head(path: Path, limit: int) -> str:
+    """Read at most *limit* characters without loading the whole file."""
+    with path.open(encoding='utf-8', errors='replace') as handle:
+        return handle.read(limit)
+
+
+@functools.cache
+def workspace_key(repo_root: Path) -> str:
+    """Stable key used to scope shared memory and sessions to a workspace."""
+    return repo_root.resolve().as_posix()
+
+
 @dataclass(frozen=True, slots=True)
 class WorkspaceContext:
     """Immutable snapshot of the current workspace for the agent's system prompt."""
@@ -40,18 +54,30 @@ class WorkspaceContext:
     recent_commits: tuple[str, ...]
     project_docs: dict[str, str] = field(default_factory=dict)
     shell_env: dict[str, str] = field(default_factory=dict)
+    # Rendered prompt sections; the snapshot never changes, but instructions are rebuilt
+    # on every model request of a run.
+    _rendered: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def discover(cls, cwd: Path | None = None) -> WorkspaceContext:
         cwd = (cwd or Path.cwd()).resolve()
-        repo_root = Path(_git(['rev-parse', '--show-toplevel'], cwd, str(cwd))).resolve()
+        # The git calls are independent subprocesses; run them side by side.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            root_future = pool.submit(_git, ['rev-parse', '--show-toplevel'], cwd, str(cwd))
+            branch_future = pool.submit(_git, ['branch', '--show-current'], cwd, '-')
+            status_future = pool.submit(_git, ['status', '--short'], cwd, 'clean')
+            log_future = pool.submit(_git, ['log', '--oneline', '-5'], cwd)
+
+            repo_root = Path(root_future.result()).resolve()
+            docs: dict[str, str] = {}
+            for name in ANCHOR_FILES:
+                path = repo_root / name
+                if path.is_file():
+                    docs[name] = _read_head(path, DOC_SNIPPET_LIMIT)
 
-        docs: dict[str, str] = {}
-        for name in ANCHOR_FILES:
-            path = repo_root / name
-            if path.is_file():
-                text = path.read_text(encoding='utf-8', errors='replace')
-                docs[name] = text[:DOC_SNIPPET_LIMIT]
+            branch = branch_future.result()
+            status = status_future.result()
+            recent_commits = tuple(log_future.result().splitlines())
 
         # Shell state from ZSH plugin hooks — sanitized to avoid leaking secrets
         shell_env: dict[str, str] = {}
@@ -65,14 +91,27 @@ class WorkspaceContext:
         return cls(
             cwd=cwd,
             repo_root=repo_root,
-            branch=_git(['branch', '--show-current'], cwd, '-'),
-            status=_git(['status', '--short'], cwd, 'clean'),
-            recent_commits=tuple(_git(['log', '--oneline', '-5'], cwd).splitlines()),
+            branch=branch,
+            status=status,
+            recent_commits=recent_commits,
             project_docs=docs,
             shell_env=shell_env,
         )
 
     def render(self) -> str:
+        rendered = self._rendered.get('full')
+        if rendered is None:
+            rendered = self._rendered['full'] = self._render_full()
+        return rendered
+
+    def render_summary(self) -> str:
+        """Compact workspace summary for routing turns and small-talk requests."""
+        rendered = self._rendered.get('summary')
+        if rendered is None:
+            rendered = self._rendered['summary'] = self._render_summary()
+        return rendered
+
+    def _render_full(self) -> str:
         commits = '\n'.join(f'  - {c}' for c in self.recent_commits) or '  - none'
         docs = '\n'.join(f'## {name}\n{body}' for name, body in self.project_docs.items())
         parts = [
@@ -89,8 +128,7 @@ class WorkspaceContext:
             parts.append(f'project_docs:\n{docs}')
         return '\n'.join(parts)
 
-    def render_summary(self) -> str:
-        """Compact workspace summary for routing turns and small-talk requests."""
+    def _render_summary(self) -> str:
         parts = [
             f'cwd: {self.cwd}',
             f'repo_root: {self.repo_root}',
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from collections import defaultdict
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.exceptions import UserError
 from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart
-from pydantic_ai.models import Model
+from pydantic_ai.models import Model, infer_model
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.output import DeferredToolRequests
 from pydantic_ai.providers.openai import OpenAIProvider
@@ -45,10 +46,14 @@ from friday.infra.mcp import create_mcp_servers
 from friday.tools import filesystem, shell
 from friday.tools import memory as memory_tools
 
+if TYPE_CHECKING:
+    from pydantic_ai.models.anthropic import AnthropicModelSettings
+
 __all__ = [
     'TOOL_FUNCTIONS',
     'AgentDeps',
     'ExecutedTurn',
+    'cached_agent',
     'create_agent',
     'execute_agent',
     'resolve_model_with_fallback',
@@ -70,7 +75,9 @@ class ExecutedTurn:
     """A completed agent turn after resolving any deferred approvals."""
 
     reply: AgentReply
+    # Full history as given to the run plus this turn, not the processor-compacted copy.
     messages: list[ModelMessage]
+    new_messages: list[ModelMessage]
 
 
 TOOL_FUNCTIONS: dict[str, Callable[..., Any]] = {
@@ -140,8 +147,6 @@ def _resolve_model(model_name: str, settings: FridaySettings) -> Model:
             provider=OpenAIProvider(base_url=base_url, api_key=api_key),
         )
 
-    from pydantic_ai.models import infer_model
-
     return infer_model(model_name)
 
 
@@ -160,10 +165,19 @@ def resolve_model_with_fallback(model_name: str, settings: FridaySettings) -> Mo
         raise
 
 
-def _build_model_settings(mode_config: ModePromptConfig) -> ModelSettings | None:
-    if not mode_config.thinking:
-        return None
-    return ModelSettings(thinking=mode_config.thinking)
+def _build_model_settings(
+    mode_config: ModePromptConfig,
+    model_name: str,
+) -> ModelSettings | None:
+    # Typed as the Anthropic TypedDict so a misspelled key fails type checking.
+    model_settings: AnthropicModelSettings = {}
+    if mode_config.thinking:
+        model_settings['thinking'] = mode_config.thinking
+    if model_name.startswith('anthropic:'):
+        # Tool schemas are static per mode and lead Anthropic's cache prefix. The
+        # instructions end with per-turn memory, so caching them would never hit.
+        model_settings['anthropic_cache_tool_definitions'] = True
+    return model_settings or None
 
 
 def _lookup_tool_spec(name: str) -> _ToolSpec:
@@ -179,10 +193,13 @@ def _lookup_tool_spec(name: str) -> _ToolSpec:
     raise KeyError(msg)
 
 
-def _build_toolsets(mode_config: ModePromptConfig, settings: FridaySettings) -> list[Any]:
+# Function toolsets depend only on the mode's tool names, so agents rebuilt after a
+# model switch reuse them instead of regenerating every tool schema.
+@functools.cache
+def _function_toolsets(tool_names: tuple[str, ...]) -> tuple[Any, ...]:
     grouped_tools: dict[str, list[Callable[..., Any]]] = defaultdict(list)
     approval_domains: set[str] = set()
-    for tool_name in mode_config.tools:
+    for tool_name in tool_names:
         spec = _lookup_tool_spec(tool_name)
         grouped_tools[spec.domain].append(spec.function)
         if spec.requires_approval:
@@ -194,6 +211,11 @@ def _build_toolsets(mode_config: ModePromptConfig, settings: FridaySettings) ->
         if domain in approval_domains:
             toolset = ApprovalRequiredToolset(toolset)
         toolsets.append(toolset)
+    return tuple(toolsets)
+
+
+def _build_toolsets(mode_config: ModePromptConfig, settings: FridaySettings) -> list[Any]:
+    toolsets: list[Any] = list(_function_toolsets(mode_config.tools))
     toolsets.extend(create_mcp_servers(settings.mcp_servers))
     log.debug(
         'built toolsets: mode_tools=%s toolset_ids=%s',
@@ -203,50 +225,51 @@ def _build_toolsets(mode_config: ModePromptConfig, settings: FridaySettings) ->
     return toolsets
 
 
-def _instructions(
-    mode_config: ModePromptConfig,
-) -> list[str | Callable[[RunContext[AgentDeps]], str]]:
+_AUTO_ROUTING_INSTRUCTIONS = (
+    'Return a structured routing decision.\n'
+    '- Use action="respond" and fill reply when you can answer directly.\n'
+    '- Use action="delegate" and fill delegate_mode + task when a specialist is needed.\n'
+    '- Prefer respond for greetings, conversation, names, preferences, simple facts, '
+    'and anything that does not require specialist work.\n'
+    '- Prefer delegate for shell commands, coding, debugging, '
+    'documentation, or deep code reading.\n'
+    '- Treat Relevant Shared Memory as trusted context for stable user and project facts.\n'
+    '- If Relevant Shared Memory already answers the question, respond directly instead of '
+    'asking the user to repeat it.\n'
+)
+
+
+def _runtime_instructions(*, summary: bool) -> Callable[[RunContext[AgentDeps]], str]:
+    heading = '## Workspace Summary' if summary else '## Workspace'
+
     def runtime_instructions(ctx: RunContext[AgentDeps]) -> str:
+        context = ctx.deps.context
+        workspace = context.render_summary() if summary else context.render()
         return (
             '## Relevant Shared Memory\n'
             f'{ctx.deps.shared_memory.render()}\n\n'
             '## Working Memory\n'
             f'{ctx.deps.memory.render()}\n\n'
-            '## Workspace\n'
-            f'{ctx.deps.context.render()}'
+            f'{heading}\n'
+            f'{workspace}'
         )
 
-    return [mode_config.system_prompt, runtime_instructions]
+    return runtime_instructions
 
 
-def _auto_instructions(
+def _instructions(
     mode_config: ModePromptConfig,
 ) -> list[str | Callable[[RunContext[AgentDeps]], str]]:
-    def runtime_instructions(ctx: RunContext[AgentDeps]) -> str:
-        return (
-            '## Relevant Shared Memory\n'
-            f'{ctx.deps.shared_memory.render()}\n\n'
-            '## Working Memory\n'
-            f'{ctx.deps.memory.render()}\n\n'
-            '## Workspace Summary\n'
-            f'{ctx.deps.context.render_summary()}'
-        )
+    return [mode_config.system_prompt, _runtime_instructions(summary=False)]
+
 
+def _auto_instructions(
+    mode_config: ModePromptConfig,
+) -> list[str | Callable[[RunContext[AgentDeps]], str]]:
     return [
         mode_config.system_prompt,
-        (
-            'Return a structured routing decision.\n'
-            '- Use action="respond" and fill reply when you can answer directly.\n'
-            '- Use action="delegate" and fill delegate_mode + task when a specialist is needed.\n'
-            '- Prefer respond for greetings, conversation, names, preferences, simple facts, '
-            'and anything that does not require specialist work.\n'
-            '- Prefer delegate for shell commands, coding, debugging, '
-            'documentation, or deep code reading.\n'
-            '- Treat Relevant Shared Memory as trusted context for stable user and project facts.\n'
-            '- If Relevant Shared Memory already answers the question, respond directly instead of '
-            'asking the user to repeat it.\n'
-        ),
-        runtime_instructions,
+        _AUTO_ROUTING_INSTRUCTIONS,
+        _runtime_instructions(summary=True),
     ]
 
 
@@ -267,18 +290,7 @@ def create_agent(
     mode_config = MODE_CONFIGS[mode]
     model_name = mode_config.model or settings.default_model
 
-    try:
-        model = _resolve_model(model_name, settings)
-    except UserError:
-        if settings.fallback_model and settings.fallback_model != model_name:
-            log.info(
-                'Model %s unavailable, falling back to %s',
-                model_name,
-                settings.fallback_model,
-            )
-            model = _resolve_model(settings.fallback_model, settings)
-        else:
-            raise
+    model = resolve_model_with_fallback(model_name, settings)
 
     if mode is AgentMode.AUTO:
         log.debug('creating auto router agent: model=%s', model_name)
@@ -291,7 +303,7 @@ def create_agent(
                 deps_type=AgentDeps,
                 name='friday-auto',
                 description=mode_config.description,
-                model_settings=_build_model_settings(mode_config),
+                model_settings=_build_model_settings(mode_config, model_name),
                 retries=2,
                 defer_model_check=True,
                 history_processors=[build_history_processor(_REQUEST_HISTORY_LIMIT)],
@@ -313,7 +325,7 @@ def create_agent(
             deps_type=AgentDeps,
             name=f'friday-{mode.value}',
             description=mode_config.description,
-            model_settings=_build_model_settings(mode_config),
+            model_settings=_build_model_settings(mode_config, model_name),
             retries=2,
             toolsets=_build_toolsets(mode_config, settings),
             defer_model_check=True,
@@ -322,6 +334,18 @@ def create_agent(
     )
 
 
+def cached_agent(deps: AgentDeps, mode: AgentMode) -> Agent[AgentDeps, Any]:
+    """Return the agent for *mode* and the current model, building it only once."""
+    key = (mode, deps.settings.default_model)
+    agent = deps.agents.get(key)
+    if agent is None:
+        agent = create_agent(mode, deps.settings, deps.context)
+        deps.agents[key] = agent
+    else:
+        log.debug('reusing cached agent: mode=%s model=%s', mode.value, key[1])
+    return agent
+
+
 async def execute_agent(
     agent: Agent[AgentDeps, Any],
     *,
@@ -334,6 +358,8 @@ async def execute_agent(
 ) -> ExecutedTurn:
     """Run an agent to completion, resolving deferred approvals along the way."""
     history = list(message_history or [])
+    previous = list(history)
+    new_messages: list[ModelMessage] = []
     deferred_results: DeferredToolResults | None = None
     next_prompt = user_prompt
     run_usage = usage or RunUsage()
@@ -367,7 +393,10 @@ async def execute_agent(
             usage=run_usage,
         )
         record_turn_result(deps.turn_stats, result, requested_model or deps.settings.default_model)
+        # all_messages() carries the history processor's compaction; keep it for the next
+        # run, but report the untouched history so callers can persist it by appending.
         history = result.all_messages()
+        new_messages.extend(result.new_messages())
 
         if isinstance(result.output, DeferredToolRequests):
             log.debug(
@@ -386,7 +415,11 @@ async def execute_agent(
                 reply_markdown=result.output.markdown,
                 record_chat_chunk=record_memory,
             )
-        return ExecutedTurn(reply=result.output, messages=history)
+        return ExecutedTurn(
+            reply=result.output,
+            messages=[*previous, *new_messages],
+            new_messages=new_messages,
+        )
 
 
 def _prepare_turn(deps: AgentDeps, user_prompt: str) -> None:
@@ -431,7 +464,7 @@ async def _run_specialist_from_auto(
     usage: RunUsage,
     requested_model: str,
 ) -> ExecutedTurn:
-    specialist = create_agent(delegate_mode, deps.settings, deps.context)
+    specialist = cached_agent(deps, delegate_mode)
     return await execute_agent(
         specialist,
         deps=deps,
@@ -490,7 +523,11 @@ async def _execute_auto_turn(
                 reply_markdown=reply_text,
                 record_chat_chunk=True,
             )
-        return ExecutedTurn(reply=AgentReply(markdown=reply_text), messages=messages)
+        return ExecutedTurn(
+            reply=AgentReply(markdown=reply_text),
+            messages=messages,
+            new_messages=messages[len(message_history) :],
+        )
 
     delegate_mode = decision.delegate_mode
     delegate_task = decision.task.strip()
@@ -505,7 +542,11 @@ async def _execute_auto_turn(
             reply_text=reply.markdown,
             model_name=requested_model or deps.settings.default_model,
         )
-        return ExecutedTurn(reply=reply, messages=messages)
+        return ExecutedTurn(
+            reply=reply,
+            messages=messages,
+            new_messages=messages[len(message_history) :],
+        )
 
     original_mode = deps.memory.mode
     try:
@@ -539,7 +580,11 @@ async def _execute_auto_turn(
             reply_markdown=executed.reply.markdown,
             record_chat_chunk=True,
         )
-    return ExecutedTurn(reply=executed.reply, messages=visible_messages)
+    return ExecutedTurn(
+        reply=executed.reply,
+        messages=visible_messages,
+        new_messages=visible_messages[len(message_history) :],
+    )
 
 
 def _resolve_deferred_requests(
@@ -5,13 +5,17 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from friday.agent.context import WorkspaceContext
 from friday.agent.stats import TurnStats
-from friday.domain.models import WorkingMemory
+from friday.domain.models import AgentMode, WorkingMemory
 from friday.infra.config import FridaySettings
 from friday.infra.memory import MemoryStore, SharedMemorySnapshot
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 
 @dataclass(slots=True)
 class AgentDeps:
@@ -28,3 +32,4 @@ class AgentDeps:
     before_approval: Callable[[], None] | None = None
     after_approval: Callable[[], None] | None = None
     turn_stats: TurnStats = field(default_factory=TurnStats)
+    agents: dict[tuple[AgentMode, str], Agent[AgentDeps, Any]] = field(default_factory=dict)
@@ -24,33 +24,28 @@ _OLD_TOOL_LIMIT = 180
 _RECENT_TURNS = 2
 
 
+def _is_user_turn(message: ModelMessage) -> bool:
+    return isinstance(message, ModelRequest) and any(
+        isinstance(part, UserPromptPart) for part in message.parts
+    )
+
+
 def build_history_processor(
     request_limit: int,
 ) -> Callable[[list[ModelMessage]], list[ModelMessage]]:
     """Keep only the most recent user turns and following messages."""
 
     def keep_recent_requests(messages: list[ModelMessage]) -> list[ModelMessage]:
-        turn_indexes = [
-            index
-            for index, message in enumerate(messages)
-            if isinstance(message, ModelRequest)
-            and any(isinstance(part, UserPromptPart) for part in message.parts)
-        ]
+        turn_indexes = [index for index, message in enumerate(messages) if _is_user_turn(message)]
+        selected = messages
         if len(turn_indexes) > request_limit:
             start = turn_indexes[-request_limit]
             selected = messages[start:]
-        else:
-            selected = messages
-        selected_turns = [
-            index
-            for index, message in enumerate(selected)
-            if isinstance(message, ModelRequest)
-            and any(isinstance(part, UserPromptPart) for part in message.parts)
-        ]
-        if len(selected_turns) <= _RECENT_TURNS:
+            turn_indexes = [index - start for index in turn_indexes[-request_limit:]]
+        if len(turn_indexes) <= _RECENT_TURNS:
             return selected
 
-        compact_until = selected_turns[-_RECENT_TURNS]
+        compact_until = turn_indexes[-_RECENT_TURNS]
         seen_read_paths: set[str] = set()
         dropped_tool_calls: set[str] = set()
         compacted: list[ModelMessage] = []
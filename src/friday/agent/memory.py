@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 
+from friday.agent.context import workspace_key as _workspace_key
 from friday.agent.deps import AgentDeps
 from friday.domain.models import MemoryKind, MemoryScope
 from friday.domain.permissions import clip, contains_secret
@@ -38,7 +39,7 @@ def load_relevant_shared_memory(deps: AgentDeps, user_prompt: str) -> SharedMemo
     if deps.memory_store is None or deps.settings.memory_top_k <= 0:
         return SharedMemorySnapshot()
 
-    workspace_key = deps.context.repo_root.resolve().as_posix()
+    workspace_key = _workspace_key(deps.context.repo_root)
     half = max(1, deps.settings.memory_top_k // 2)
     retrieved = deps.memory_store.select_prompt_snapshot(
         user_prompt,
@@ -96,7 +97,7 @@ def record_completed_turn(
     if deps.memory_store is None:
         return
 
-    workspace_key = deps.context.repo_root.resolve().as_posix()
+    workspace_key = _workspace_key(deps.context.repo_root)
 
     if record_chat_chunk and deps.session_id and not contains_secret(user_prompt):
         log.debug('indexing chat turn: session=%s', deps.session_id)
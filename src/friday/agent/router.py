@@ -5,7 +5,7 @@ from __future__ import annotations
 from pydantic_ai import RunContext
 
 from friday.agent.contracts import AgentReply
-from friday.agent.core import create_agent, execute_agent
+from friday.agent.core import cached_agent, create_agent, execute_agent
 from friday.agent.deps import AgentDeps
 from friday.domain.models import AgentMode
 
@@ -13,7 +13,7 @@ __all__ = ['DELEGATE_TOOLS', 'create_router_agent']
 
 
 async def _run_sub_agent(ctx: RunContext[AgentDeps], mode: AgentMode, task: str) -> AgentReply:
-    agent = create_agent(mode, ctx.deps.settings, ctx.deps.context)
+    agent = cached_agent(ctx.deps, mode)
     original_mode = ctx.deps.memory.mode
     original_shared_memory = ctx.deps.shared_memory
     try:
@@ -7,9 +7,7 @@ from typing import Annotated
 import typer
 from dotenv import load_dotenv
 
-from friday.agent.context import WorkspaceContext
-from friday.cli.ask import run_ask
-from friday.cli.chat import run_chat, run_chat_with_session
+from friday.agent.context import WorkspaceContext, workspace_key
 from friday.cli.models import list_models
 from friday.cli.output import console, print_error, print_info
 from friday.cli.resources import (
@@ -17,10 +15,11 @@ from friday.cli.resources import (
     interactive_mode_pick,
     interactive_model_pick,
     interactive_session_pick,
-    list_mode_names,
     print_memory_search_results,
     print_memory_table,
+    print_mode_names,
     print_session_table,
+    print_settings,
     set_default_mode,
     set_default_model,
 )
@@ -56,12 +55,32 @@ def _parse_mode(value: str | None) -> AgentMode | None:
     return AgentMode(value)
 
 
+# The agent runtime pulls in pydantic-ai and provider SDKs; import it only for
+# commands that actually run an agent.
+def run_ask(question: str, mode: AgentMode | None, settings: FridaySettings) -> None:
+    from friday.cli.ask import run_ask as _run_ask
+
+    _run_ask(question, mode, settings)
+
+
+def run_chat(mode: AgentMode, settings: FridaySettings) -> None:
+    from friday.cli.chat import run_chat as _run_chat
+
+    _run_chat(mode, settings)
+
+
+def run_chat_with_session(session_id: str, settings: FridaySettings) -> None:
+    from friday.cli.chat import run_chat_with_session as _run_chat_with_session
+
+    _run_chat_with_session(session_id, settings)
+
+
 def _memory_store(settings: FridaySettings) -> SQLiteMemoryStore:
     return SQLiteMemoryStore(settings.memory_db_path)
 
 
 def _workspace_key() -> str:
-    return WorkspaceContext.discover().repo_root.resolve().as_posix()
+    return workspace_key(WorkspaceContext.discover().repo_root)
 
 
 @app.command()
@@ -127,14 +146,12 @@ def models_set(
 @mode_app.callback(invoke_without_command=True)
 def modes_root(ctx: typer.Context) -> None:
     if ctx.invoked_subcommand is None:
-        for mode in list_mode_names():
-            console.print(mode)
+        print_mode_names()
 
 
 @mode_app.command('show')
 def modes_list() -> None:
-    for mode in list_mode_names():
-        console.print(mode)
+    print_mode_names()
 
 
 @mode_app.command('set')
@@ -306,19 +323,20 @@ def _sessions_list(*, plain: bool) -> None:
     store = JsonSessionStore(settings.session_dir)
     sessions = store.list_sessions(limit=20)
     if plain:
+        lines = []
         for s in sessions:
             msg = s.last_user_message[:40].replace('\n', ' ') if s.last_user_message else ''
             ts = s.created_at[:16].replace('T', ' ') if s.created_at else ''
-            console.print(f'{s.id}\t{ts}\t{s.turn_count}t\t{msg}')
+            lines.append(f'{s.id}\t{ts}\t{s.turn_count}t\t{msg}')
+        # One literal write: stored messages are user text, not rich markup.
+        if lines:
+            console.print('\n'.join(lines), markup=False, highlight=False)
         return
     print_session_table(sessions)
 
 
 def _settings_list() -> None:
-    settings = _get_settings()
-    for field_name in FridaySettings.model_fields:
-        value = getattr(settings, field_name)
-        console.print(f'  {field_name} = {value}')
+    print_settings(_get_settings())
 
 
 def _memories_list() -> None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from contextlib import AbstractContextManager, nullcontext
 
 from pydantic_ai.exceptions import UserError
 from rich.status import Status
@@ -14,6 +15,7 @@ from friday.agent.core import create_agent, execute_agent
 from friday.agent.deps import AgentDeps
 from friday.agent.stats import format_turn_summary
 from friday.cli.debug import setup_file_logging
+from friday.cli.loop import new_event_loop
 from friday.cli.output import console, print_error, print_info, print_markdown, print_run_summary
 from friday.domain.models import AgentMode
 from friday.infra.config import FridaySettings
@@ -57,7 +59,13 @@ def run_ask(
     try:
         agent = create_agent(selected_mode, settings, context)
         deps.turn_stats.reset()
-        with Status('Thinking...', console=console, spinner='dots') as status:
+        # Piped output never shows the spinner; skip its refresh thread entirely.
+        spinner: AbstractContextManager[Status | None] = (
+            Status('Thinking...', console=console, spinner='dots')
+            if stdout_is_tty
+            else nullcontext()
+        )
+        with spinner as status:
             if status is not None:
                 deps.before_approval = status.stop
                 deps.after_approval = status.start
@@ -68,7 +76,8 @@ def run_ask(
                     deps=deps,
                     user_prompt=question,
                     requested_model=settings.default_model,
-                )
+                ),
+                loop_factory=new_event_loop,
             )
             deps.turn_stats.stop_timer()
         print_markdown(executed.reply.markdown)
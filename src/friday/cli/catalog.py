@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 __all__ = [
     'REPL_COMMANDS',
@@ -36,26 +38,30 @@ RESOURCE_COMMANDS: tuple[ResourceCommand, ...] = (
     ),
 )
 
-REPL_COMMANDS: dict[str, str] = {
-    '/help': 'Show available commands',
-    '/model': 'Model picker (or /model show | /model <name>)',
-    '/mode': 'Mode picker (or /mode show | /mode <name>)',
-    '/session': 'Session picker (or /session show | resume | new | delete)',
-    '/setting': 'Show settings (or /setting <key> | /setting <key>=<value>)',
-    '/memory': 'List memories (or /memory show | search | add | delete)',
-    '/debug': 'Toggle debug (or /debug on | off | show)',
-    '/clear': 'Clear conversation',
-    '/quit': 'Exit Friday',
-    '/exit': 'Exit Friday',
-}
+REPL_COMMANDS: Mapping[str, str] = MappingProxyType(
+    {
+        '/help': 'Show available commands',
+        '/model': 'Model picker (or /model show | /model <name>)',
+        '/mode': 'Mode picker (or /mode show | /mode <name>)',
+        '/session': 'Session picker (or /session show | resume | new | delete)',
+        '/setting': 'Show settings (or /setting <key> | /setting <key>=<value>)',
+        '/memory': 'List memories (or /memory show | search | add | delete)',
+        '/debug': 'Toggle debug (or /debug on | off | show)',
+        '/clear': 'Clear conversation',
+        '/quit': 'Exit Friday',
+        '/exit': 'Exit Friday',
+    }
+)
+
+_RESOURCE_NAMES = tuple(resource.name for resource in RESOURCE_COMMANDS)
+_RESOURCE_SUBCOMMANDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {resource.name: resource.subcommands for resource in RESOURCE_COMMANDS}
+)
 
 
 def resource_names() -> tuple[str, ...]:
-    return tuple(resource.name for resource in RESOURCE_COMMANDS)
+    return _RESOURCE_NAMES
 
 
 def resource_subcommands(name: str) -> tuple[str, ...]:
-    for resource in RESOURCE_COMMANDS:
-        if resource.name == name:
-            return resource.subcommands
-    return ()
+    return _RESOURCE_SUBCOMMANDS.get(name, ())
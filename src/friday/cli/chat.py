@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
-import uuid
+import os
+import secrets
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
 from pydantic_ai import Agent
 from pydantic_ai.exceptions import UserError
-from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
+from pydantic_ai.messages import ModelMessage
 from rich.status import Status
 
-from friday.agent.context import WorkspaceContext
-from friday.agent.core import create_agent, execute_agent
+from friday.agent.context import WorkspaceContext, workspace_key
+from friday.agent.core import cached_agent, execute_agent
 from friday.agent.deps import AgentDeps
 from friday.agent.stats import format_turn_summary
 from friday.cli.catalog import REPL_COMMANDS
@@ -28,6 +33,7 @@ from friday.cli.debug import (
     set_debug_logging,
     setup_file_logging,
 )
+from friday.cli.loop import new_event_loop
 from friday.cli.models import list_models
 from friday.cli.output import console, print_error, print_info, print_markdown, print_run_summary
 from friday.cli.resources import (
@@ -38,7 +44,9 @@ from friday.cli.resources import (
     list_mode_names,
     print_memory_search_results,
     print_memory_table,
+    print_mode_names,
     print_session_table,
+    print_settings,
 )
 from friday.cli.theme import PT_STYLE, make_prompt_message
 from friday.domain.models import AgentMode, MemoryKind, MemoryScope
@@ -67,19 +75,54 @@ class ChatState:
     debug_enabled: bool = False
 
 
-def _session_id() -> str:
-    return f'{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}'
+def _session_id(now: datetime) -> str:
+    return f'{now:%Y%m%d-%H%M%S}-{secrets.token_hex(3)}'
 
 
 def _new_session_meta(model: str, mode: AgentMode) -> SessionMeta:
+    now = datetime.now()
     return SessionMeta(
-        id=_session_id(),
-        created_at=datetime.now().isoformat(),
+        id=_session_id(now),
+        created_at=now.isoformat(),
         model=model,
         mode=mode.value,
     )
 
 
+_HISTORY_LIMIT = 500
+
+
+class _ReplHistory(FileHistory):
+    """File-backed prompt history bounded to the newest entries, without consecutive repeats."""
+
+    def load_history_strings(self) -> Iterable[str]:
+        strings = list(itertools.islice(super().load_history_strings(), 2 * _HISTORY_LIMIT + 1))
+        if len(strings) > 2 * _HISTORY_LIMIT:
+            self._compact(strings[:_HISTORY_LIMIT])
+        return strings[:_HISTORY_LIMIT]
+
+    def _compact(self, newest_first: list[str]) -> None:
+        """Rewrite the file with only the kept entries so startup parsing stays bounded."""
+        path = Path(os.fsdecode(self.filename))
+        tmp = path.with_suffix('.tmp')
+        stamp = f'\n# {datetime.now()}\n'
+        chunks = [
+            stamp + ''.join(f'+{line}\n' for line in string.split('\n'))
+            for string in reversed(newest_first)
+        ]
+        try:
+            tmp.write_text(''.join(chunks), encoding='utf-8')
+            tmp.replace(path)
+        except OSError:
+            log.debug('history compaction failed', exc_info=True)
+
+    def append_string(self, string: str) -> None:
+        if self._loaded_strings and self._loaded_strings[0] == string:
+            return
+        super().append_string(string)
+        del self._loaded_strings[_HISTORY_LIMIT:]
+
+
 def _parse_mode(value: str, fallback: AgentMode) -> AgentMode:
     try:
         return AgentMode(value)
@@ -96,13 +139,8 @@ def _effective_settings(settings: FridaySettings, state: ChatState) -> FridaySet
     )
 
 
-def _print_settings(settings: FridaySettings) -> None:
-    for field_name in FridaySettings.model_fields:
-        console.print(f'  {field_name} = {getattr(settings, field_name)}')
-
-
 def _workspace_key(context: WorkspaceContext) -> str:
-    return context.repo_root.resolve().as_posix()
+    return workspace_key(context.repo_root)
 
 
 def _save_session(
@@ -110,10 +148,9 @@ def _save_session(
     state: ChatState,
     context: WorkspaceContext,
 ) -> None:
-    serialized = ModelMessagesTypeAdapter.dump_python(state.message_history, mode='json')
-    meta = state.session_meta.model_copy(deep=True)
-    meta.turn_count = extract_turn_count(serialized)
-    meta.last_user_message = extract_last_user_message(serialized)
+    meta = state.session_meta.model_copy()
+    meta.turn_count = extract_turn_count(state.message_history)
+    meta.last_user_message = extract_last_user_message(state.message_history)
     meta.model = state.model
     meta.mode = state.mode.value
     meta.workspace_key = _workspace_key(context)
@@ -122,9 +159,12 @@ def _save_session(
     log.debug('session saved: id=%s turns=%s', meta.id, meta.turn_count)
 
 
+# The command catalog is static, so the help listing is formatted once.
+_HELP_TEXT = '\n'.join(f'  [info]{name:<12}[/info] {desc}' for name, desc in REPL_COMMANDS.items())
+
+
 def _print_help() -> None:
-    for name, desc in REPL_COMMANDS.items():
-        console.print(f'  [info]{name:<12}[/info] {desc}')
+    console.print(_HELP_TEXT)
 
 
 def _handle_debug(args: list[str], state: ChatState) -> bool:
@@ -171,8 +211,7 @@ def _handle_models(args: list[str], state: ChatState, settings: FridaySettings)
 def _handle_modes(args: list[str], state: ChatState) -> bool:
     # /mode show — list without interaction
     if args and args[0] == 'show':
-        for mode in list_mode_names():
-            console.print(mode)
+        print_mode_names()
         return True
 
     # /mode <name> — direct switch
@@ -373,7 +412,7 @@ def _handle_settings(args: list[str], state: ChatState, settings: FridaySettings
 
     # /setting show — list all
     if not args or (args and args[0] == 'show'):
-        _print_settings(effective)
+        print_settings(effective)
         return True
 
     arg = args[0]
@@ -500,7 +539,7 @@ def _build_agent(
     deps.memory.mode = state.mode
     deps.session_id = state.session_meta.id
     log.debug('building agent: mode=%s model=%s', state.mode.value, state.model)
-    return create_agent(state.mode, effective_settings, context)
+    return cached_agent(deps, state.mode)
 
 
 def run_chat(
@@ -527,15 +566,16 @@ def run_chat(
     )
     deps.memory.mode = state.mode
 
+    completer = FridayCompleter(context.repo_root, settings.session_dir, settings.memory_db_path)
+    # Warm the completer's first directory listing and memory DB while the banner prints.
+    threading.Thread(target=completer.prewarm, name='friday-prewarm', daemon=True).start()
     prompt_session: PromptSession[str] = PromptSession(
-        history=FileHistory(str(history_path)),
-        completer=FridayCompleter(
-            context.repo_root,
-            settings.session_dir,
-            settings.memory_db_path,
-        ),
+        history=_ReplHistory(str(history_path)),
+        completer=completer,
         style=PT_STYLE,
         complete_while_typing=True,
+        # Completion touches the filesystem and memory DB; keep it off the input thread.
+        complete_in_thread=True,
     )
 
     try:
@@ -570,7 +610,7 @@ def run_chat(
 
     # Reuse a single event loop for the entire session to avoid
     # httpx/openai connection pool issues with asyncio.run() per turn.
-    loop = asyncio.new_event_loop()
+    loop = new_event_loop()
 
     try:
         _chat_loop(
@@ -664,7 +704,8 @@ def _chat_loop(
                 deps.turn_stats.stop_timer()
             print_markdown(executed.reply.markdown)
             print_run_summary(format_turn_summary(deps.turn_stats))
-            state.message_history = executed.messages
+            # Append the untouched turn; executed.messages may differ only by compaction.
+            state.message_history = [*state.message_history, *executed.new_messages]
             _save_session(store, state, context)
         except UserError as exc:
             print_error(f'{exc}')
@@ -2,15 +2,56 @@
 
 from __future__ import annotations
 
+import bisect
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 from prompt_toolkit.completion import CompleteEvent, Completer, Completion
 from prompt_toolkit.document import Document
 
-from friday.cli.catalog import REPL_COMMANDS, resource_subcommands
+from friday.agent.context import workspace_key
+from friday.cli.catalog import REPL_COMMANDS, resource_names, resource_subcommands
 from friday.cli.resources import list_mode_names
 from friday.infra.config import FridaySettings
-from friday.infra.memory import SQLiteMemoryStore
+from friday.infra.memory import MemoryStore, SQLiteMemoryStore
+
+log = logging.getLogger(__name__)
+
+# Static completion candidates, built once instead of on every keystroke.
+_SUBCOMMAND_ITEMS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {f'/{name}': dict.fromkeys(resource_subcommands(name), '') for name in resource_names()}
+)
+_MODE_ITEMS = dict.fromkeys(list_mode_names(), '')
+_SETTING_ITEMS = dict.fromkeys(FridaySettings.model_fields, '')
+_DEBUG_ITEMS = dict.fromkeys(('on', 'off', 'show'), '')
+
+# Seconds a listing of saved sessions/memories is reused across keystrokes.
+_ID_CACHE_TTL = 2.0
+
+_DIR_CACHE_SIZE = 32
+_MAX_CHAR = chr(sys.maxunicode)
+
+
+@dataclass(frozen=True, slots=True)
+class _DirListing:
+    mtime_ns: int
+    keys: list[str]
+    entries: list[tuple[str, bool]]
+
+
+def _current_token(text: str) -> str:
+    """Return the word ending at the cursor, scanning back from the end only."""
+    if not text or text[-1].isspace():
+        return ''
+    return text.rsplit(maxsplit=1)[-1]
 
 
 class FridayCompleter(Completer):
@@ -25,6 +66,20 @@ class FridayCompleter(Completer):
         self.workspace_root = workspace_root
         self.session_dir = session_dir
         self.memory_db_path = memory_db_path
+        self._memory_store: MemoryStore | None = None
+        self._id_cache: dict[str, tuple[float, list[str]]] = {}
+        self._dir_cache: dict[Path, _DirListing] = {}
+        # prewarm() runs on its own thread while completions run on prompt_toolkit's;
+        # the lock serializes cache fills so a keystroke waits for an in-flight prewarm.
+        self._cache_lock = threading.Lock()
+
+    def prewarm(self) -> None:
+        """Fill the workspace listing and open the memory DB ahead of the first keystroke."""
+        try:
+            self._dir_listing(self.workspace_root)
+            self._memory_ids()
+        except (OSError, sqlite3.Error):
+            log.debug('completer prewarm failed', exc_info=True)
 
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
@@ -34,9 +89,9 @@ class FridayCompleter(Completer):
         if text.startswith('/'):
             return list(self._complete_slash(text))
 
-        at_pos = text.rfind('@')
-        if at_pos >= 0:
-            partial = text[at_pos + 1 :]
+        token = _current_token(text)
+        if token.startswith('@'):
+            partial = token[1:]
             return list(self._complete_files(partial, len(partial)))
 
         return []
@@ -53,21 +108,18 @@ class FridayCompleter(Completer):
             return []
 
         current = '' if text.endswith(' ') else parts[-1]
-        subcommands = resource_subcommands(command.removeprefix('/'))
+        subcommands = _SUBCOMMAND_ITEMS.get(command)
         if not subcommands:
             return []
 
         if len(parts) == 1 or (len(parts) == 2 and not text.endswith(' ')):
-            items = {subcommand: '' for subcommand in subcommands}
-            return self._matching_completions(items, current)
+            return self._matching_completions(subcommands, current)
 
         if command == '/mode' and len(parts) >= 2:
-            items = {mode: '' for mode in list_mode_names()}
-            return self._matching_completions(items, current)
+            return self._matching_completions(_MODE_ITEMS, current)
 
         if command == '/setting' and len(parts) >= 2:
-            items = {name: '' for name in FridaySettings.model_fields}
-            return self._matching_completions(items, current)
+            return self._matching_completions(_SETTING_ITEMS, current)
 
         if command == '/session' and parts[1] in {'resume', 'delete'}:
             items = {sid: 'saved session' for sid in self._session_ids()}
@@ -78,14 +130,13 @@ class FridayCompleter(Completer):
             return self._matching_completions(items, current)
 
         if command == '/debug':
-            items = {'on': '', 'off': '', 'show': ''}
-            return self._matching_completions(items, current)
+            return self._matching_completions(_DEBUG_ITEMS, current)
 
         return []
 
     def _matching_completions(
         self,
-        items: dict[str, str],
+        items: Mapping[str, str],
         partial: str,
     ) -> list[Completion]:
         completions: list[Completion] = []
@@ -101,21 +152,64 @@ class FridayCompleter(Completer):
             )
         return completions
 
+    def _cached_ids(self, key: str, load: Callable[[], list[str]]) -> list[str]:
+        with self._cache_lock:
+            now = time.monotonic()
+            cached = self._id_cache.get(key)
+            if cached is not None and now - cached[0] < _ID_CACHE_TTL:
+                return cached[1]
+            ids = load()
+            self._id_cache[key] = (now, ids)
+            return ids
+
     def _session_ids(self) -> list[str]:
+        return self._cached_ids('session', self._load_session_ids)
+
+    def _memory_ids(self) -> list[str]:
+        return self._cached_ids('memory', self._load_memory_ids)
+
+    def _load_session_ids(self) -> list[str]:
         if self.session_dir is None or not self.session_dir.exists():
             return []
         return sorted(path.stem for path in self.session_dir.glob('*.json'))
 
-    def _memory_ids(self) -> list[str]:
+    def _load_memory_ids(self) -> list[str]:
         if self.memory_db_path is None:
             return []
-        store = SQLiteMemoryStore(self.memory_db_path)
-        records = store.list_memories(
-            workspace_key=self.workspace_root.resolve().as_posix(),
+        if self._memory_store is None:
+            self._memory_store = SQLiteMemoryStore(self.memory_db_path)
+        records = self._memory_store.list_memories(
+            workspace_key=workspace_key(self.workspace_root),
             limit=30,
         )
         return [record.id for record in records]
 
+    def _dir_listing(self, directory: Path) -> _DirListing:
+        """Return the sorted, non-hidden entries of *directory*, reused until it changes."""
+        with self._cache_lock:
+            mtime_ns = directory.stat().st_mtime_ns
+            cached = self._dir_cache.get(directory)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                return cached
+
+            # scandir's is_dir() answers from the readdir d_type, avoiding a stat per entry.
+            with os.scandir(directory) as it:
+                entries = sorted(
+                    (entry.name.lower(), entry.name, entry.is_dir())
+                    for entry in it
+                    if not entry.name.startswith('.')
+                )
+            listing = _DirListing(
+                mtime_ns=mtime_ns,
+                keys=[key for key, _, _ in entries],
+                entries=[(name, is_dir) for _, name, is_dir in entries],
+            )
+            self._dir_cache.pop(directory, None)
+            if len(self._dir_cache) >= _DIR_CACHE_SIZE:
+                self._dir_cache.pop(next(iter(self._dir_cache)), None)
+            self._dir_cache[directory] = listing
+            return listing
+
     def _complete_files(self, partial: str, word_len: int) -> list[Completion]:
         if '/' in partial:
             parent_str, prefix = partial.rsplit('/', 1)
@@ -128,29 +222,27 @@ class FridayCompleter(Completer):
         if not search_dir.is_dir():
             return []
 
-        completions: list[Completion] = []
         try:
-            for entry in sorted(search_dir.iterdir()):
-                name = entry.name
-                if name.startswith('.'):
-                    continue
-                if prefix and not name.lower().startswith(prefix.lower()):
-                    continue
-
-                rel = f'{parent_str}/{name}' if parent_str else name
-                display = f'{name}/' if entry.is_dir() else name
-                if entry.is_dir():
-                    rel += '/'
-
-                completions.append(
-                    Completion(
-                        rel,
-                        start_position=-word_len,
-                        display=display,
-                        display_meta='dir' if entry.is_dir() else '',
-                    )
-                )
+            listing = self._dir_listing(search_dir)
         except PermissionError:
             return []
 
-        return completions[:50]
+        # Keys are sorted lowercase names, so the prefix matches form one contiguous run.
+        key = prefix.lower()
+        start = bisect.bisect_left(listing.keys, key)
+        end = bisect.bisect_right(listing.keys, key + _MAX_CHAR, lo=start)
+
+        completions: list[Completion] = []
+        for name, is_dir in listing.entries[start : min(end, start + 50)]:
+            rel = f'{parent_str}/{name}' if parent_str else name
+            if is_dir:
+                rel += '/'
+            completions.append(
+                Completion(
+                    rel,
+                    start_position=-word_len,
+                    display=f'{name}/' if is_dir else name,
+                    display_meta='dir' if is_dir else '',
+                )
+            )
+        return completions
@@ -3,28 +3,37 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 import termios
 import tty
 
 from pydantic_ai.messages import ToolCallPart
+from rich.console import Group, RenderableType
 from rich.panel import Panel
+from rich.text import Text
 
 from friday.cli.output import console
 from friday.cli.theme import COLORS
+from friday.domain.permissions import clip
 
 __all__ = ['confirm_action', 'confirm_deferred_tool']
 
 _UP = ('\x1b[A', 'k')
 _DOWN = ('\x1b[B', 'j')
 _ENTER = ('\r', '\n')
+_MAX_DETAIL_VALUE_CHARS = 2000
+# Only file bodies being written may be shortened for display; anything that executes or
+# selects what changes (commands, paths, patch old/new) is always shown in full.
+_CLIPPABLE_ARGS = frozenset({('write_file', 'content')})
 
 
 def confirm_action(title: str, description: str, detail: str = '') -> bool:
     """Prompt the user to approve a sensitive action with arrow-key selector."""
-    content = description
+    content: RenderableType = description
     if detail:
-        content += f'\n\n{detail}'
+        # Detail is raw tool arguments: render it literally instead of parsing it as markup.
+        content = Group(description, '', Text(detail))
 
     console.print()
     console.print(
@@ -73,11 +82,10 @@ def _confirm_selector() -> bool:
     old = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        # Use os.read for unbuffered single-byte reads in raw mode
-        import os as _os
 
+        # Use os.read for unbuffered single-byte reads in raw mode
         def _readch() -> str:
-            return _os.read(fd, 1).decode('utf-8', errors='replace')
+            return os.read(fd, 1).decode('utf-8', errors='replace')
 
         while True:
             ch = _readch()
@@ -119,9 +127,20 @@ def _confirm_selector() -> bool:
 
 def confirm_deferred_tool(call: ToolCallPart) -> bool:
     """Render a deferred tool call and ask the user to approve it."""
-    detail = json.dumps(call.args_as_dict(), indent=2, ensure_ascii=False, sort_keys=True)
-    return confirm_action(
-        title='Confirm',
-        description=f'[warning]{call.tool_name}[/warning]: execute deferred tool call',
-        detail=detail,
-    )
+    args = call.args_as_dict()
+    clipped: list[str] = []
+    for key, value in args.items():
+        if (
+            (call.tool_name, key) in _CLIPPABLE_ARGS
+            and isinstance(value, str)
+            and len(value) > _MAX_DETAIL_VALUE_CHARS
+        ):
+            args[key] = clip(value, _MAX_DETAIL_VALUE_CHARS)
+            clipped.append(key)
+    detail = json.dumps(args, indent=2, ensure_ascii=False, sort_keys=True)
+    description = f'[warning]{call.tool_name}[/warning]: execute deferred tool call'
+    if clipped:
+        description += (
+            f'\n[muted]{", ".join(clipped)} shortened for display; written in full[/muted]'
+        )
+    return confirm_action(title='Confirm', description=description, detail=detail)
@@ -0,0 +1,18 @@
+"""Event loop selection — uvloop when installed, stock asyncio otherwise."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+__all__ = ['new_event_loop']
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the loop that runs agent turns (install the ``fast`` extra for uvloop)."""
+    # Imported by name: uvloop is an optional extra, absent from the default environment.
+    try:
+        uvloop = importlib.import_module('uvloop')
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
+from itertools import chain
+from typing import TYPE_CHECKING
 
 import httpx
-from anthropic import Anthropic
-from openai import OpenAI
 
 from friday.cli.output import console, print_error
 from friday.infra.config import FridaySettings
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from openai import OpenAI
+
 # Provider configs: (prefix, env_key for api_key, base_url or None)
 _PROVIDERS: list[tuple[str, str, str | None]] = [
     ('openai', 'OPENAI_API_KEY', None),
@@ -19,11 +26,31 @@ _PROVIDERS: list[tuple[str, str, str | None]] = [
 ]
 
 
+# Clients are kept for the process so repeated /model listings reuse their connection pools.
+# The SDKs are imported on first use; together they add about a second to CLI startup.
+@cache
+def _openai_client(api_key: str, base_url: str | None) -> OpenAI:
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@cache
+def _anthropic_client(api_key: str) -> Anthropic:
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+@cache
+def _http_client() -> httpx.Client:
+    return httpx.Client(timeout=3)
+
+
 def _list_from_api(prefix: str, api_key: str, base_url: str | None) -> list[str]:
     """Query /v1/models via the OpenAI SDK and return prefixed IDs."""
-    client = OpenAI(api_key=api_key, base_url=base_url)
     try:
-        response = client.models.list()
+        response = _openai_client(api_key, base_url).models.list()
         return sorted(f'{prefix}:{m.id}' for m in response.data)
     except Exception as exc:
         print_error(f'{prefix}: {exc}')
@@ -33,7 +60,7 @@ def _list_from_api(prefix: str, api_key: str, base_url: str | None) -> list[str]
 def _list_ollama() -> list[str]:
     """List local Ollama models."""
     try:
-        resp = httpx.get('http://localhost:11434/api/tags', timeout=3)
+        resp = _http_client().get('http://localhost:11434/api/tags')
         resp.raise_for_status()
         data = resp.json()
         return sorted(f'ollama:{m["name"]}' for m in data.get('models', []))
@@ -47,8 +74,7 @@ def _list_anthropic() -> list[str]:
     if not api_key:
         return []
     try:
-        client = Anthropic(api_key=api_key)
-        response = client.models.list()
+        response = _anthropic_client(api_key).models.list()
         return sorted(f'anthropic:{m.id}' for m in response.data)
     except Exception:
         return []
@@ -56,10 +82,10 @@ def _list_anthropic() -> list[str]:
 
 def fetch_models(settings: FridaySettings, provider_filter: str | None = None) -> list[str]:
     """Fetch available models from all configured providers. Returns a flat list."""
-    all_models: list[str] = []
+    queries: list[Callable[[], list[str]]] = []
 
     if not provider_filter or provider_filter == 'anthropic':
-        all_models.extend(_list_anthropic())
+        queries.append(_list_anthropic)
 
     for prefix, env_key, base_url in _PROVIDERS:
         if provider_filter and provider_filter != prefix:
@@ -69,12 +95,17 @@ def fetch_models(settings: FridaySettings, provider_filter: str | None = None) -
             continue
         if prefix == 'zai':
             base_url = settings.zai_base_url
-        all_models.extend(_list_from_api(prefix, api_key, base_url))
+        queries.append(partial(_list_from_api, prefix, api_key, base_url))
 
     if not provider_filter or provider_filter == 'ollama':
-        all_models.extend(_list_ollama())
+        queries.append(_list_ollama)
 
-    return all_models
+    if not queries:
+        return []
+    # Each query is a blocking HTTP round-trip; run them side by side, keeping provider order.
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        results = list(pool.map(lambda query: query(), queries))
+    return list(chain.from_iterable(results))
 
 
 def list_models(settings: FridaySettings, provider_filter: str | None = None) -> None:
@@ -85,5 +116,6 @@ def list_models(settings: FridaySettings, provider_filter: str | None = None) ->
         console.print('[muted]No models found. Set API keys in .env or start Ollama.[/muted]')
         return
 
-    for model in all_models:
-        console.print(model)
+    with console:
+        for model in all_models:
+            console.print(model)
@@ -25,9 +25,11 @@ def build_response_panel(text: str) -> Panel:
 
 def print_markdown(text: str) -> None:
     """Render markdown text to the console."""
-    console.print()
-    console.print(build_response_panel(text))
-    console.print()
+    # Buffer the spacing and panel so the reply reaches the terminal in one write.
+    with console:
+        console.print()
+        console.print(build_response_panel(text))
+        console.print()
 
 
 def print_info(text: str) -> None:
@@ -40,6 +40,12 @@ class InteractivePicker:
         term_h = shutil.get_terminal_size().lines
         self.max_visible = max_visible or max(5, term_h - _HEADER_LINES - 3)
 
+        # Lowercased once; matches for the last query are kept so typing more
+        # characters only narrows the previous result instead of rescanning.
+        self._lowered = [(item.lower(), item) for item in items]
+        self._matches = self._lowered
+        self._matched_query = ''
+
         self.filtered = list(self.all_items)
         self._set_initial_cursor()
 
@@ -53,11 +59,14 @@ class InteractivePicker:
 
     def _apply_filter(self) -> None:
         """Filter items by query (case-insensitive substring match)."""
-        if not self.query:
-            self.filtered = list(self.all_items)
+        q = self.query.lower()
+        if not q:
+            self._matches = self._lowered
         else:
-            q = self.query.lower()
-            self.filtered = [it for it in self.all_items if q in it.lower()]
+            source = self._matches if q.startswith(self._matched_query) else self._lowered
+            self._matches = [pair for pair in source if q in pair[0]]
+        self._matched_query = q
+        self.filtered = [item for _, item in self._matches]
         self.index = min(self.index, max(0, len(self.filtered) - 1))
         self.scroll_offset = 0
         self._adjust_scroll()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
 
 from rich.table import Table
 
@@ -24,26 +23,28 @@ __all__ = [
     'list_mode_names',
     'print_memory_search_results',
     'print_memory_table',
+    'print_mode_names',
     'print_session_table',
+    'print_settings',
     'set_default_mode',
     'set_default_model',
 ]
 
 
-@dataclass(frozen=True, slots=True)
-class SessionChoice:
-    id: str
-    label: str
+def list_mode_names() -> list[str]:
+    return [mode.value for mode in AgentMode]
 
 
-@dataclass(frozen=True, slots=True)
-class MemoryChoice:
-    id: str
-    label: str
+def print_mode_names() -> None:
+    with console:
+        for mode in list_mode_names():
+            console.print(mode)
 
 
-def list_mode_names() -> list[str]:
-    return [mode.value for mode in AgentMode]
+def print_settings(settings: FridaySettings) -> None:
+    with console:
+        for field_name in FridaySettings.model_fields:
+            console.print(f'  {field_name} = {getattr(settings, field_name)}')
 
 
 def interactive_model_pick(settings: FridaySettings, current: str = '') -> str | None:
@@ -72,24 +73,11 @@ def interactive_session_pick(store: JsonSessionStore, current: str = '') -> str
         print_info('No saved sessions.')
         return None
 
-    choices = [
-        SessionChoice(
-            id=session.id,
-            label=f'{session.id}  ({session.turn_count}t) {session.last_user_message or ""}',
-        )
+    ids_by_label = {
+        f'{session.id}  ({session.turn_count}t) {session.last_user_message or ""}': session.id
         for session in sessions
-    ]
-    selected = _interactive_pick(
-        [choice.label for choice in choices],
-        current=next((choice.label for choice in choices if choice.id == current), ''),
-        title='Select session',
-    )
-    if selected is None:
-        return None
-    for choice in choices:
-        if choice.label == selected:
-            return choice.id
-    return None
+    }
+    return _pick_id(ids_by_label, current=current, title='Select session')
 
 
 def interactive_memory_pick(
@@ -107,24 +95,11 @@ def interactive_memory_pick(
         print_info('No saved memories.')
         return None
 
-    choices = [
-        MemoryChoice(
-            id=record.id,
-            label=(f'{record.id}  [{record.scope.value}/{record.kind.value}] {record.text}'),
-        )
+    ids_by_label = {
+        f'{record.id}  [{record.scope.value}/{record.kind.value}] {record.text}': record.id
         for record in records
-    ]
-    selected = _interactive_pick(
-        [choice.label for choice in choices],
-        current=next((choice.label for choice in choices if choice.id == current), ''),
-        title='Select memory',
-    )
-    if selected is None:
-        return None
-    for choice in choices:
-        if choice.label == selected:
-            return choice.id
-    return None
+    }
+    return _pick_id(ids_by_label, current=current, title='Select memory')
 
 
 def print_session_table(sessions: list[SessionMeta], active_id: str = '') -> None:
@@ -215,5 +190,12 @@ def _interactive_pick(items: list[str], *, current: str, title: str) -> str | No
     return pick(items=items, current=current, title=title)
 
 
+def _pick_id(ids_by_label: dict[str, str], *, current: str, title: str) -> str | None:
+    """Pick a label and map it back to its id without rescanning the choices."""
+    current_label = next((label for label, id_ in ids_by_label.items() if id_ == current), '')
+    selected = _interactive_pick(list(ids_by_label), current=current_label, title=title)
+    return ids_by_label.get(selected) if selected is not None else None
+
+
 def _is_tty() -> bool:
     return sys.stdin.isatty() and sys.stdout.isatty()
@@ -10,20 +10,22 @@ MAX_TOOL_OUTPUT = 4000
 
 # ── Secret detection ───────────────────────────────────────────
 
-_SECRET_PATTERNS: list[re.Pattern[str]] = [
+# Case-insensitive patterns are matched against the lowercased text once;
+# re.IGNORECASE costs roughly twice as much per scan.
+_CASEFOLDED_SECRET_PATTERNS: list[re.Pattern[str]] = [
     # Keywords (en/pt)
-    re.compile(
-        r'\b(api[_ -]?key|token|secret|password|passwd|senha|chave|credential)\b',
-        re.IGNORECASE,
-    ),
+    re.compile(r'\b(api[_ -]?key|token|secret|password|passwd|senha|chave|credential)\b'),
+    # Bearer tokens
+    re.compile(r'bearer\s+[a-z0-9_\-.]+'),
+    # Long hex strings (generic tokens/hashes > 32 chars)
+    re.compile(r'[0-9a-f]{32,}'),
+]
+
+_SECRET_PATTERNS: list[re.Pattern[str]] = [
     # AWS access keys
     re.compile(r'AKIA[0-9A-Z]{16}'),
-    # Bearer tokens
-    re.compile(r'Bearer\s+[a-zA-Z0-9_\-.]+', re.IGNORECASE),
     # URLs with embedded credentials
     re.compile(r'://[^/:@\s]+:[^/@\s]+@'),
-    # Long hex strings (generic tokens/hashes > 32 chars)
-    re.compile(r'[0-9a-f]{32,}', re.IGNORECASE),
     # SSH/PGP key markers
     re.compile(r'-----BEGIN\s+(RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----'),
     # GitHub/GitLab tokens
@@ -33,7 +35,10 @@ _SECRET_PATTERNS: list[re.Pattern[str]] = [
 
 def contains_secret(text: str) -> bool:
     """Return True if *text* appears to contain a secret or credential."""
-    return any(pattern.search(text) for pattern in _SECRET_PATTERNS)
+    if any(pattern.search(text) for pattern in _SECRET_PATTERNS):
+        return True
+    lowered = text.lower()
+    return any(pattern.search(lowered) for pattern in _CASEFOLDED_SECRET_PATTERNS)
 
 
 def sanitize_for_prompt(text: str, limit: int = 200) -> str:
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import re
+import secrets
 import sqlite3
-import uuid
 from contextlib import closing
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from friday.domain.models import MemoryKind, MemoryScope
 from friday.domain.permissions import clip
@@ -26,6 +28,8 @@ __all__ = [
 ]
 
 GLOBAL_WORKSPACE_KEY = '*'
+# Database paths whose directory and schema were already set up by this process.
+_READY_PATHS: set[Path] = set()
 _TOKEN_RE = re.compile(r'[\w:-]+', re.UNICODE)
 _SEARCH_CANDIDATE_LIMIT = 18
 _STOPWORDS = frozenset(
@@ -103,13 +107,13 @@ _FTS5_OPERATORS = {'AND', 'OR', 'NOT', 'NEAR'}
 _MAX_QUERY_LENGTH = 500
 
 
+# Strip FTS5 special chars (), *, :, ^, + and double embedded quotes in one pass.
+_FTS_ESCAPE_TABLE = str.maketrans({'"': '""'} | dict.fromkeys('()*:^+'))
+
+
 def _fts_escape_token(token: str) -> str:
     """Escape a single token for safe use in FTS5 MATCH queries."""
-    # Strip FTS5 special chars: (), *, :, ^, +
-    cleaned = token.replace('"', '""')
-    for ch in ('(', ')', '*', ':', '^', '+'):
-        cleaned = cleaned.replace(ch, '')
-    return cleaned.strip()
+    return token.translate(_FTS_ESCAPE_TABLE).strip()
 
 
 def _fts_query(query: str) -> str:
@@ -127,12 +131,20 @@ def _fts_query(query: str) -> str:
     return ' OR '.join(escaped) if escaped else '""'
 
 
-def _recency_boost(timestamp: str) -> float:
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime | None:
+    """Parse a stored ISO timestamp; rows are re-scored every turn, so repeats are common."""
     try:
-        created = datetime.fromisoformat(timestamp)
+        return datetime.fromisoformat(timestamp)
     except ValueError:
+        return None
+
+
+def _recency_boost(timestamp: str, now: datetime) -> float:
+    created = _parse_timestamp(timestamp)
+    if created is None:
         return 0.0
-    age_days = max((datetime.now(UTC) - created).total_seconds() / 86_400, 0.0)
+    age_days = max((now - created).total_seconds() / 86_400, 0.0)
     return max(0.0, 0.3 - min(age_days, 30.0) * 0.01)
 
 
@@ -190,8 +202,15 @@ class SharedMemorySnapshot(BaseModel):
 
     records: list[MemorySearchResult] = Field(default_factory=list)
     chats: list[MemorySearchResult] = Field(default_factory=list)
+    # Snapshots are replaced per turn, never mutated, but rendered on every model request.
+    _rendered: str | None = PrivateAttr(default=None)
 
     def render(self) -> str:
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
+
+    def _render(self) -> str:
         if not self.records and not self.chats:
             return '- none'
 
@@ -269,8 +288,9 @@ class SQLiteMemoryStore:
 
     def __init__(self, path: Path) -> None:
         self.path = path.expanduser()
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._schema_ready = False
+        self._schema_ready = self.path in _READY_PATHS
+        if not self._schema_ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
 
     def save_memory(
         self,
@@ -295,7 +315,7 @@ class SQLiteMemoryStore:
             ).fetchone()
 
             created = existing is None
-            record_id = f'mem-{uuid.uuid4().hex[:10]}' if existing is None else str(existing['id'])
+            record_id = f'mem-{secrets.token_hex(5)}' if existing is None else str(existing['id'])
             stored_kind = kind.value
             stored_pinned = pinned
             if existing is not None:
@@ -405,7 +425,7 @@ class SQLiteMemoryStore:
                 'SELECT id FROM chat_chunks WHERE session_id = ? AND normalized_text = ?',
                 (session_id, normalized_text),
             ).fetchone()
-            chunk_id = f'chat-{uuid.uuid4().hex[:10]}' if existing is None else str(existing['id'])
+            chunk_id = f'chat-{secrets.token_hex(5)}' if existing is None else str(existing['id'])
 
             if existing is not None:
                 conn.execute(
@@ -493,13 +513,23 @@ class SQLiteMemoryStore:
                 ),
             ).fetchall()
 
-        results = [
-            self._search_result_from_memory_row(row, workspace_key, query_terms)
+        # Rank raw rows first and only build result models for the ones returned.
+        # One clock reading serves the recency boost of every candidate.
+        now = datetime.now(UTC)
+        scored: list[tuple[float, sqlite3.Row, Literal['memory', 'chat']]] = [
+            (self._memory_row_score(row, workspace_key, query_terms, now), row, 'memory')
             for row in memory_rows
         ]
-        results.extend(self._search_result_from_chat_row(row, query_terms) for row in chat_rows)
-        results.sort(key=lambda result: (result.score, result.created_at), reverse=True)
-        return results[:limit]
+        scored.extend(
+            (self._chat_row_score(row, query_terms, now), row, 'chat') for row in chat_rows
+        )
+        top = heapq.nlargest(limit, scored, key=lambda item: (item[0], str(item[1]['created_at'])))
+        return [
+            self._search_result_from_memory_row(row, score)
+            if source == 'memory'
+            else self._search_result_from_chat_row(row, score)
+            for score, row, source in top
+        ]
 
     def select_prompt_snapshot(
         self,
@@ -526,6 +556,7 @@ class SQLiteMemoryStore:
         if not self._schema_ready:
             self._ensure_schema(conn)
             self._schema_ready = True
+            _READY_PATHS.add(self.path)
         return conn
 
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
@@ -606,19 +637,18 @@ class SQLiteMemoryStore:
             updated_at=str(row['updated_at']),
         )
 
-    def _search_result_from_memory_row(
+    def _memory_row_score(
         self,
         row: sqlite3.Row,
         workspace_key: str,
         query_terms: list[str],
-    ) -> MemorySearchResult:
-        base_score = -float(row['rank'])
-        text = str(row['text'])
+        now: datetime,
+    ) -> float:
         score = (
-            base_score
+            -float(row['rank'])
             + 0.2
-            + _recency_boost(str(row['updated_at']))
-            + _overlap_boost(text, query_terms)
+            + _recency_boost(str(row['updated_at']), now)
+            + _overlap_boost(str(row['text']), query_terms)
         )
         if (
             str(row['workspace_key']) == workspace_key
@@ -627,11 +657,28 @@ class SQLiteMemoryStore:
             score += 1.0
         if bool(row['pinned']):
             score += 0.5
+        return score
+
+    def _chat_row_score(
+        self,
+        row: sqlite3.Row,
+        query_terms: list[str],
+        now: datetime,
+    ) -> float:
+        snippet = self._render_chat_text(str(row['user_prompt']), str(row['assistant_reply']))
+        return (
+            -float(row['rank'])
+            + 0.05
+            + _recency_boost(str(row['updated_at']), now)
+            + _overlap_boost(snippet, query_terms)
+        )
+
+    def _search_result_from_memory_row(self, row: sqlite3.Row, score: float) -> MemorySearchResult:
         return MemorySearchResult(
             id=str(row['id']),
             source='memory',
             score=score,
-            snippet=clip(text, 320),
+            snippet=clip(str(row['text']), 320),
             workspace_key=str(row['workspace_key']),
             created_at=str(row['created_at']),
             scope=MemoryScope(str(row['scope'])),
@@ -639,19 +686,8 @@ class SQLiteMemoryStore:
             pinned=bool(row['pinned']),
         )
 
-    def _search_result_from_chat_row(
-        self,
-        row: sqlite3.Row,
-        query_terms: list[str],
-    ) -> MemorySearchResult:
-        base_score = -float(row['rank'])
+    def _search_result_from_chat_row(self, row: sqlite3.Row, score: float) -> MemorySearchResult:
         snippet = self._render_chat_text(str(row['user_prompt']), str(row['assistant_reply']))
-        score = (
-            base_score
-            + 0.05
-            + _recency_boost(str(row['updated_at']))
-            + _overlap_boost(snippet, query_terms)
-        )
         return MemorySearchResult(
             id=str(row['id']),
             source='chat',
@@ -1,14 +1,21 @@
-"""Session persistence backed by JSON files."""
+"""Session persistence backed by JSON metadata and append-only JSONL message logs."""
 
 from __future__ import annotations
 
-import json
+import heapq
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    UserPromptPart,
+)
+from pydantic_core import from_json
 
 from friday.domain.permissions import clip
 
@@ -22,10 +29,23 @@ __all__ = [
 ]
 
 
+_MESSAGE_ADAPTER: TypeAdapter[ModelMessage] = TypeAdapter(ModelMessage)
+
+
 def _utcnow() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime
+
+
+def _is_prefix(prefix: list[ModelMessage], messages: list[ModelMessage]) -> bool:
+    if len(prefix) > len(messages):
+        return False
+    return all(old is new or old == new for old, new in zip(prefix, messages, strict=False))
+
+
 class SessionMeta(BaseModel):
     """Lightweight session metadata for listing and resuming."""
 
@@ -41,7 +61,7 @@ class SessionMeta(BaseModel):
 class SessionEnvelope(BaseModel):
     """Serialized session payload stored on disk."""
 
-    schema_version: int = 2
+    schema_version: int = 3
     meta: SessionMeta
     messages: list[dict[str, Any]] = Field(default_factory=list)
 
@@ -54,24 +74,46 @@ class SessionData(BaseModel):
 
 
 class JsonSessionStore:
-    """Stores sessions as JSON files in a directory."""
+    """Stores session metadata as JSON and messages as append-only JSONL files."""
 
     def __init__(self, root: Path) -> None:
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
+        # session id -> messages already on disk, used to append only the new tail
+        self._persisted: dict[str, list[ModelMessage]] = {}
+        # session id -> metadata last written by this store, to skip identical rewrites
+        self._saved_meta: dict[str, SessionMeta] = {}
 
     def _path(self, session_id: str) -> Path:
         return self.root / f'{session_id}.json'
 
+    def _messages_path(self, session_id: str) -> Path:
+        return self.root / f'{session_id}.messages.jsonl'
+
     def save(self, data: SessionData) -> None:
-        envelope = SessionEnvelope(
-            meta=data.meta,
-            messages=ModelMessagesTypeAdapter.dump_python(data.messages, mode='json'),
-        )
-        self._path(data.meta.id).write_text(
-            envelope.model_dump_json(indent=2),
+        session_id = data.meta.id
+        messages_path = self._messages_path(session_id)
+        persisted = self._persisted.get(session_id)
+        if (
+            persisted is not None
+            and messages_path.exists()
+            and _is_prefix(persisted, data.messages)
+        ):
+            tail = data.messages[len(persisted) :]
+            if tail:
+                self._write_messages(messages_path, tail, mode='ab')
+        else:
+            self._write_messages(messages_path, data.messages, mode='wb')
+        self._persisted[session_id] = list(data.messages)
+
+        if self._saved_meta.get(session_id) == data.meta:
+            return
+        envelope = SessionEnvelope(meta=data.meta)
+        self._path(session_id).write_text(
+            envelope.model_dump_json(indent=2, exclude={'messages'}),
             encoding='utf-8',
         )
+        self._saved_meta[session_id] = data.meta.model_copy()
 
     def load(self, session_id: str) -> SessionData:
         path = self._path(session_id)
@@ -79,7 +121,7 @@ class JsonSessionStore:
             msg = f'Session not found: {session_id}'
             raise FileNotFoundError(msg)
 
-        raw = json.loads(path.read_text(encoding='utf-8'))
+        raw = from_json(path.read_bytes())
         if 'schema_version' in raw:
             envelope = SessionEnvelope.model_validate(raw)
         else:
@@ -89,26 +131,37 @@ class JsonSessionStore:
                 messages=raw.get('messages', []),
             )
 
-        messages = ModelMessagesTypeAdapter.validate_python(envelope.messages)
+        if envelope.schema_version >= 3:
+            messages = list(self.iter_messages(session_id))
+            self._persisted[session_id] = list(messages)
+        else:
+            messages = ModelMessagesTypeAdapter.validate_python(envelope.messages)
         return SessionData(meta=envelope.meta, messages=messages)
 
+    def iter_messages(self, session_id: str) -> Iterator[ModelMessage]:
+        """Stream messages from the JSONL log without reading the whole file at once."""
+        path = self._messages_path(session_id)
+        if not path.exists():
+            return
+        with path.open('rb') as handle:
+            for line in handle:
+                if line.strip():
+                    yield _MESSAGE_ADAPTER.validate_json(line)
+
     def latest_id(self) -> str | None:
-        files = sorted(self.root.glob('*.json'), key=lambda path: path.stat().st_mtime)
-        return files[-1].stem if files else None
+        latest = max(self.root.glob('*.json'), key=_mtime, default=None)
+        return latest.stem if latest else None
 
     def list_sessions(self, limit: int = 20) -> list[SessionMeta]:
-        files = sorted(
-            self.root.glob('*.json'),
-            key=lambda path: path.stat().st_mtime,
-            reverse=True,
-        )
+        # Only the newest *limit* files are needed; avoid sorting the whole directory.
+        files = heapq.nlargest(limit, self.root.glob('*.json'), key=_mtime)
         sessions: list[SessionMeta] = []
-        for file_path in files[:limit]:
+        for file_path in files:
             try:
-                raw = json.loads(file_path.read_text(encoding='utf-8'))
+                raw = from_json(file_path.read_bytes())
                 meta = raw['meta'] if 'meta' in raw else {}
                 sessions.append(SessionMeta.model_validate(meta))
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 continue
         return sessions
 
@@ -117,26 +170,35 @@ class JsonSessionStore:
         if not path.exists():
             return False
         path.unlink()
+        self._messages_path(session_id).unlink(missing_ok=True)
+        self._persisted.pop(session_id, None)
+        self._saved_meta.pop(session_id, None)
         return True
 
+    @staticmethod
+    def _write_messages(path: Path, messages: list[ModelMessage], *, mode: str) -> None:
+        with path.open(mode) as handle:
+            for message in messages:
+                handle.write(_MESSAGE_ADAPTER.dump_json(message) + b'\n')
+
 
-def extract_last_user_message(messages: list[dict[str, Any]]) -> str:
-    """Extract the last user message text from serialized message history."""
+def extract_last_user_message(messages: list[ModelMessage]) -> str:
+    """Extract the last user message text from the message history."""
     for message in reversed(messages):
-        if message.get('kind') != 'request':
+        if not isinstance(message, ModelRequest):
             continue
-        for part in reversed(message.get('parts', [])):
-            if part.get('part_kind') == 'user-prompt':
-                return clip(part.get('content', ''), 80)
+        for part in reversed(message.parts):
+            if isinstance(part, UserPromptPart):
+                content = part.content if isinstance(part.content, str) else ''
+                return clip(content, 80)
     return ''
 
 
-def extract_turn_count(messages: list[dict[str, Any]]) -> int:
+def extract_turn_count(messages: list[ModelMessage]) -> int:
     """Count only top-level user prompts, ignoring tool-return requests."""
-    count = 0
-    for message in messages:
-        if message.get('kind') != 'request':
-            continue
-        if any(part.get('part_kind') == 'user-prompt' for part in message.get('parts', [])):
-            count += 1
-    return count
+    return sum(
+        1
+        for message in messages
+        if isinstance(message, ModelRequest)
+        and any(isinstance(part, UserPromptPart) for part in message.parts)
+    )
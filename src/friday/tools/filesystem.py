@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import logging
+import shutil
 import subprocess
+from collections.abc import Iterator, Sequence
+from pathlib import Path
 
 from pydantic_ai import RunContext
 
@@ -18,6 +24,73 @@ from friday.domain.validation import (
 
 log = logging.getLogger(__name__)
 
+# ── Blocking helpers, run via asyncio.to_thread ────────────────
+
+_READ_CACHE_SIZE = 64
+# Larger files are read fresh on every call instead of being pinned in the cache.
+_READ_CACHE_MAX_BYTES = 1_000_000
+
+
+def _load_lines(resolved: Path) -> list[str]:
+    return resolved.read_text(encoding='utf-8', errors='replace').splitlines()
+
+
+# mtime and size are part of the key, so an edited file misses instead of going stale.
+@functools.lru_cache(maxsize=_READ_CACHE_SIZE)
+def _cached_lines(resolved: Path, mtime_ns: int, size: int) -> tuple[str, ...]:
+    return tuple(_load_lines(resolved))
+
+
+def _read_lines(resolved: Path) -> Sequence[str]:
+    stat = resolved.stat()
+    if stat.st_size > _READ_CACHE_MAX_BYTES:
+        return _load_lines(resolved)
+    return _cached_lines(resolved, stat.st_mtime_ns, stat.st_size)
+
+
+def _write_text(resolved: Path, content: str) -> None:
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    resolved.write_text(content, encoding='utf-8')
+    # A same-size rewrite within the filesystem's mtime granularity would still hit.
+    _cached_lines.cache_clear()
+
+
+def _replace_once(resolved: Path, old: str, new: str) -> int:
+    """Replace *old* if it occurs exactly once. Return the occurrence count."""
+    text = resolved.read_text(encoding='utf-8', errors='replace')
+    count = text.count(old)
+    if count == 1:
+        resolved.write_text(text.replace(old, new, 1), encoding='utf-8')
+        _cached_lines.cache_clear()
+    return count
+
+
+def _sorted_glob(root: Path, pattern: str, limit: int) -> tuple[list[Path], int]:
+    """Return the first *limit* matches in sorted order and the total match count."""
+    total = 0
+
+    def counted() -> Iterator[Path]:
+        nonlocal total
+        for match in root.glob(pattern):
+            total += 1
+            yield match
+
+    # A bounded heap keeps only *limit* paths instead of sorting every match.
+    first = heapq.nsmallest(limit, counted())
+    return first, total
+
+
+@functools.cache
+def _has_ripgrep() -> bool:
+    return shutil.which('rg') is not None
+
+
+def _run_search(cmd: list[str], fallback: list[str]) -> str:
+    # Resolve rg once instead of paying a failed exec on every search where it is missing.
+    args = cmd if _has_ripgrep() else fallback
+    result = subprocess.run(args, capture_output=True, text=True, timeout=10, check=False)
+    return result.stdout.strip()
+
 
 async def read_file(ctx: RunContext[AgentDeps], path: str, start: int = 1, end: int = 200) -> str:
     """Read a UTF-8 file by line range."""
@@ -26,7 +99,7 @@ async def read_file(ctx: RunContext[AgentDeps], path: str, start: int = 1, end:
     log.debug('tool read_file: path=%s start=%s end=%s', path, start, end)
     resolved = safe_path(ctx.deps.workspace_root, path)
     ctx.deps.memory.remember(ctx.deps.memory.files, path, 8)
-    lines = resolved.read_text(encoding='utf-8', errors='replace').splitlines()
+    lines = await asyncio.to_thread(_read_lines, resolved)
     numbered = [f'{i:>4}: {line}' for i, line in enumerate(lines[start - 1 : end], start)]
     return '\n'.join(numbered)
 
@@ -37,8 +110,7 @@ async def write_file(ctx: RunContext[AgentDeps], path: str, content: str) -> str
     validate_content(content)
     log.debug('tool write_file: path=%s chars=%s', path, len(content))
     resolved = safe_path(ctx.deps.workspace_root, path)
-    resolved.parent.mkdir(parents=True, exist_ok=True)
-    resolved.write_text(content, encoding='utf-8')
+    await asyncio.to_thread(_write_text, resolved, content)
     ctx.deps.memory.remember(ctx.deps.memory.files, path, 8)
     return f'wrote {len(content)} chars to {path}'
 
@@ -48,14 +120,12 @@ async def patch_file(ctx: RunContext[AgentDeps], path: str, old: str, new: str)
     validate_path(path)
     log.debug('tool patch_file: path=%s old_chars=%s new_chars=%s', path, len(old), len(new))
     resolved = safe_path(ctx.deps.workspace_root, path)
-    text = resolved.read_text(encoding='utf-8', errors='replace')
-    count = text.count(old)
+    count = await asyncio.to_thread(_replace_once, resolved, old, new)
     if count == 0:
         return f'error: old string not found in {path}'
     if count > 1:
         return f'error: old string found {count} times in {path} — must be unique'
 
-    resolved.write_text(text.replace(old, new, 1), encoding='utf-8')
     ctx.deps.memory.remember(ctx.deps.memory.files, path, 8)
     return f'patched {path}'
 
@@ -66,10 +136,10 @@ async def list_files(ctx: RunContext[AgentDeps], path: str = '.', pattern: str =
     validate_pattern(pattern)
     log.debug('tool list_files: path=%s pattern=%s', path, pattern)
     resolved = safe_path(ctx.deps.workspace_root, path)
-    matches = sorted(resolved.glob(pattern))
-    lines = [str(m.relative_to(ctx.deps.workspace_root)) for m in matches[:100]]
-    if len(matches) > 100:
-        lines.append(f'...[{len(matches) - 100} more]')
+    matches, total = await asyncio.to_thread(_sorted_glob, resolved, pattern, 100)
+    lines = [str(m.relative_to(ctx.deps.workspace_root)) for m in matches]
+    if total > 100:
+        lines.append(f'...[{total - 100} more]')
     return '\n'.join(lines) or 'no matches'
 
 
@@ -92,11 +162,6 @@ async def search(ctx: RunContext[AgentDeps], pattern: str, path: str = '.', glob
     ]
     if glob:
         cmd.insert(1, f'--glob={glob}')
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=False)
-        output = result.stdout.strip()
-    except FileNotFoundError:
-        cmd = ['grep', '-rn', '--max-count=50', pattern, str(search_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=False)
-        output = result.stdout.strip()
+    fallback = ['grep', '-rn', '--max-count=50', pattern, str(search_path)]
+    output = await asyncio.to_thread(_run_search, cmd, fallback)
     return clip(output) if output else 'no matches'
@@ -6,6 +6,7 @@ import logging
 
 from pydantic_ai import RunContext
 
+from friday.agent.context import workspace_key
 from friday.agent.deps import AgentDeps
 from friday.domain.models import MemoryKind, MemoryScope
 from friday.domain.permissions import clip
@@ -16,7 +17,7 @@ log = logging.getLogger(__name__)
 
 
 def _workspace_key(ctx: RunContext[AgentDeps]) -> str:
-    return ctx.deps.context.repo_root.resolve().as_posix()
+    return workspace_key(ctx.deps.context.repo_root)
 
 
 async def search_memory(ctx: RunContext[AgentDeps], query: str) -> str:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import subprocess
+from pathlib import Path
 
 from pydantic_ai import RunContext
 
@@ -16,6 +18,18 @@ log = logging.getLogger(__name__)
 MAX_SHELL_OUTPUT = 8000
 
 
+def _run(command: str, cwd: Path, timeout: int) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        command,
+        shell=True,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+
+
 async def run_shell(ctx: RunContext[AgentDeps], command: str, timeout: int = 30) -> str:
     """Run a shell command in the workspace root. Timeout in seconds (max 120)."""
     try:
@@ -33,15 +47,7 @@ async def run_shell(ctx: RunContext[AgentDeps], command: str, timeout: int = 30)
     ctx.deps.memory.remember(ctx.deps.memory.notes, f'shell: {clip(command, 80)}', 8)
 
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=ctx.deps.workspace_root,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
+        result = await asyncio.to_thread(_run, command, ctx.deps.workspace_root, timeout)
         output = result.stdout + result.stderr
         exit_info = f'[exit {result.returncode}]'
         return clip(f'{exit_info}\n{output.strip()}', MAX_SHELL_OUTPUT)
@@ -56,3 +56,31 @@ def test_run_ask_prints_summary_after_answer(monkeypatch, tmp_path: Path) -> Non
     assert summaries == [
         'model: anthropic:claude-sonnet-4-20250514  tokens: 17 total, 12 in, 5 out  cost: n/d'
     ]
+
+
+def test_run_ask_skips_spinner_when_output_is_piped(monkeypatch, tmp_path: Path) -> None:
+    rendered: list[str] = []
+
+    def _no_status(*args, **kwargs):
+        raise AssertionError('spinner should not be created for piped output')
+
+    monkeypatch.setattr(
+        ask_module.WorkspaceContext,
+        'discover',
+        staticmethod(lambda: SimpleNamespace(repo_root=tmp_path)),
+    )
+    monkeypatch.setattr(ask_module.sys, 'stdin', SimpleNamespace(isatty=lambda: True))
+    monkeypatch.setattr(ask_module.sys, 'stdout', SimpleNamespace(isatty=lambda: False))
+    monkeypatch.setattr(ask_module, 'create_agent', lambda mode, settings, context: object())
+    monkeypatch.setattr(ask_module, 'execute_agent', _execute_agent)
+    monkeypatch.setattr(ask_module, 'format_turn_summary', lambda stats: '')
+    monkeypatch.setattr(ask_module, 'Status', _no_status)
+    monkeypatch.setattr(ask_module, 'print_markdown', rendered.append)
+    monkeypatch.setattr(ask_module, 'print_run_summary', lambda text: None)
+
+    settings = FridaySettings(session_dir=tmp_path / 'sessions', config_dir=tmp_path / 'config')
+    settings.resolve_paths()
+
+    ask_module.run_ask('hi', None, settings)
+
+    assert rendered == ['hello from friday']
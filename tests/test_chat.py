@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+from prompt_toolkit.history import FileHistory
 from pydantic_ai.messages import ModelRequest, UserPromptPart
 
 from friday.cli import chat as chat_module
@@ -210,3 +211,34 @@ def test_debug_show_reports_current_state(monkeypatch, tmp_path: Path) -> None:
 
     assert handled is True
     assert info == ['Debug is on']
+
+
+def test_repl_history_skips_consecutive_duplicates_and_bounds_load(tmp_path: Path) -> None:
+    path = tmp_path / 'history'
+    history = chat_module._ReplHistory(str(path))
+    for text in ['one', 'one', 'two', 'one']:
+        history.append_string(text)
+
+    assert history.get_strings() == ['one', 'two', 'one']
+
+    for index in range(chat_module._HISTORY_LIMIT + 10):
+        history.append_string(f'cmd {index}')
+    reloaded = list(chat_module._ReplHistory(str(path)).load_history_strings())
+
+    assert len(history.get_strings()) == chat_module._HISTORY_LIMIT
+    assert len(reloaded) == chat_module._HISTORY_LIMIT
+    assert reloaded[0] == f'cmd {chat_module._HISTORY_LIMIT + 9}'
+
+
+def test_repl_history_compacts_oversized_file(tmp_path: Path) -> None:
+    path = tmp_path / 'history'
+    writer = FileHistory(str(path))
+    for index in range(2 * chat_module._HISTORY_LIMIT + 5):
+        writer.store_string(f'cmd {index}\nmore')
+
+    loaded = list(chat_module._ReplHistory(str(path)).load_history_strings())
+    reloaded = list(FileHistory(str(path)).load_history_strings())
+
+    assert len(loaded) == chat_module._HISTORY_LIMIT
+    assert reloaded == loaded
+    assert reloaded[0] == f'cmd {2 * chat_module._HISTORY_LIMIT + 4}\nmore'
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from pathlib import Path
 from types import SimpleNamespace
 
 from typer.testing import CliRunner
 
 from friday.cli import app as app_module
+from friday.cli import models as models_module
 from friday.cli.app import app
+from friday.cli.loop import new_event_loop
 from friday.domain.models import MemoryKind, MemoryScope
 from friday.infra.config import FridaySettings
 from friday.infra.sessions import JsonSessionStore, SessionData, SessionMeta
@@ -57,6 +61,34 @@ def test_models_default_action_calls_list(monkeypatch, tmp_path: Path) -> None:
     assert calls == [None]
 
 
+def test_fetch_models_keeps_provider_order(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    monkeypatch.delenv('MISTRAL_API_KEY', raising=False)
+    monkeypatch.delenv('ZAI_API_KEY', raising=False)
+    monkeypatch.setattr(models_module, '_list_anthropic', lambda: ['anthropic:a'])
+    monkeypatch.setattr(models_module, '_list_ollama', lambda: ['ollama:c'])
+    monkeypatch.setattr(
+        models_module,
+        '_list_from_api',
+        lambda prefix, api_key, base_url: [f'{prefix}:b'],
+    )
+
+    models = models_module.fetch_models(_settings(tmp_path))
+
+    assert models == ['anthropic:a', 'openai:b', 'ollama:c']
+    assert models_module.fetch_models(_settings(tmp_path), 'mistral') == []
+
+
+def test_new_event_loop_falls_back_without_uvloop(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+
+    loop = new_event_loop()
+    try:
+        assert isinstance(loop, asyncio.BaseEventLoop)
+    finally:
+        loop.close()
+
+
 def test_unknown_command_shows_help() -> None:
     result = runner.invoke(app, ['nonexistent'])
     assert result.exit_code != 0
@@ -86,6 +118,27 @@ def test_sessions_default_action_lists_saved_sessions(monkeypatch, tmp_path: Pat
     assert 'abc123' in result.output
 
 
+def test_sessions_plain_lists_rows_literally(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    store = JsonSessionStore(settings.session_dir)
+    for session_id, message in [('a1', '[bold]x[/bold]'), ('b2', 'second\nline')]:
+        meta = SessionMeta(
+            id=session_id,
+            created_at='2026-04-09T12:00:00',
+            turn_count=1,
+            last_user_message=message,
+        )
+        store.save(SessionData(meta=meta, messages=[]))
+    monkeypatch.setattr(app_module, '_get_settings', lambda: settings)
+
+    result = runner.invoke(app, ['session', '--plain'])
+
+    assert result.exit_code == 0
+    assert '[bold]x[/bold]' in result.output
+    assert 'second line' in result.output
+    assert len(result.output.splitlines()) == 2
+
+
 def test_sessions_set_invokes_chat_with_session(monkeypatch, tmp_path: Path) -> None:
     settings = _settings(tmp_path)
     called: list[str] = []
@@ -0,0 +1,86 @@
+"""Tests for REPL slash-command and file completions."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from friday.cli import completer as completer_module
+from friday.cli.completer import FridayCompleter
+
+
+def _complete(completer: FridayCompleter, text: str) -> list[str]:
+    return [item.text for item in completer.get_completions(Document(text), CompleteEvent())]
+
+
+def test_session_ids_are_reused_within_ttl(monkeypatch, tmp_path: Path) -> None:
+    (tmp_path / 'first.json').write_text('{}')
+    completer = FridayCompleter(tmp_path, session_dir=tmp_path)
+
+    assert _complete(completer, '/session resume ') == ['first']
+
+    (tmp_path / 'second.json').write_text('{}')
+    assert _complete(completer, '/session resume ') == ['first']
+
+    monkeypatch.setattr(completer_module, '_ID_CACHE_TTL', 0.0)
+    assert _complete(completer, '/session resume ') == ['first', 'second']
+
+
+def test_file_completion_only_for_word_at_cursor(tmp_path: Path) -> None:
+    (tmp_path / 'readme.md').write_text('')
+    completer = FridayCompleter(tmp_path)
+
+    assert _complete(completer, 'look at @rea') == ['readme.md']
+    assert _complete(completer, 'look at @readme.md and ') == []
+
+
+def test_file_completion_matches_prefix_case_insensitively(tmp_path: Path) -> None:
+    for name in ['Readme.md', 'requirements.txt', 'src', '.env', 'setup.py']:
+        (tmp_path / name).write_text('')
+    (tmp_path / 'sub').mkdir()
+    completer = FridayCompleter(tmp_path)
+
+    assert _complete(completer, '@re') == ['Readme.md', 'requirements.txt']
+    assert _complete(completer, '@s') == ['setup.py', 'src', 'sub/']
+    assert _complete(completer, '@') == [
+        'Readme.md',
+        'requirements.txt',
+        'setup.py',
+        'src',
+        'sub/',
+    ]
+
+
+def test_prewarm_caches_workspace_listing_and_memory_schema(tmp_path: Path) -> None:
+    (tmp_path / 'readme.md').write_text('')
+    db_path = tmp_path / 'memory.db'
+    completer = FridayCompleter(tmp_path, memory_db_path=db_path)
+
+    completer.prewarm()
+
+    assert tmp_path in completer._dir_cache
+    assert db_path.exists()
+
+
+def test_completion_waits_for_in_flight_prewarm_instead_of_reloading(tmp_path: Path) -> None:
+    completer = FridayCompleter(tmp_path)
+    started = threading.Event()
+    calls: list[int] = []
+
+    def slow_load() -> list[str]:
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return ['m1']
+
+    prewarm = threading.Thread(target=completer._cached_ids, args=('memory', slow_load))
+    prewarm.start()
+    started.wait()
+
+    assert completer._cached_ids('memory', slow_load) == ['m1']
+    prewarm.join()
+    assert len(calls) == 1
@@ -6,7 +6,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
-from friday.agent.context import WorkspaceContext
+from friday.agent.context import WorkspaceContext, workspace_key
 
 
 class TestWorkspaceContext:
@@ -48,3 +48,14 @@ class TestWorkspaceContext:
         summary = ctx.render_summary()
         assert 'cwd:' in summary
         assert 'recent_commits' not in summary
+
+    def test_render_is_built_once_per_snapshot(self, tmp_workspace: Path) -> None:
+        ctx = WorkspaceContext.discover(tmp_workspace)
+        assert ctx.render() is ctx.render()
+        assert ctx.render_summary() is ctx.render_summary()
+        assert ctx == WorkspaceContext.discover(tmp_workspace)
+
+    def test_workspace_key_is_resolved_posix_path(self, tmp_workspace: Path) -> None:
+        nested = tmp_workspace / 'sub' / '..'
+        assert workspace_key(nested) == tmp_workspace.resolve().as_posix()
+        assert workspace_key(nested) is workspace_key(nested)
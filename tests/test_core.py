@@ -6,7 +6,13 @@ import asyncio
 from pathlib import Path
 from types import SimpleNamespace
 
-from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
 from pydantic_ai.models.function import FunctionModel
 from pydantic_ai.models.test import TestModel
 from pydantic_ai.output import DeferredToolRequests
@@ -15,13 +21,21 @@ from pydantic_ai.toolsets import FunctionToolset
 from pydantic_ai.usage import RunUsage
 
 from friday.agent.contracts import AgentReply, RouterDecision, RouterDecisionAction
-from friday.agent.core import _prepare_turn, create_agent, execute_agent
+from friday.agent.core import (
+    _build_model_settings,
+    _build_toolsets,
+    _prepare_turn,
+    cached_agent,
+    create_agent,
+    execute_agent,
+)
 from friday.agent.deps import AgentDeps
 from friday.agent.memory import record_completed_turn
 from friday.agent.modes import MODE_CONFIGS
 from friday.domain.models import AgentMode, MemoryKind, MemoryScope
 from friday.infra.config import FridaySettings
 from friday.infra.memory import SQLiteMemoryStore
+from friday.infra.sessions import JsonSessionStore, SessionData, SessionMeta
 
 
 class FakeRunResult:
@@ -41,6 +55,9 @@ class FakeRunResult:
     def all_messages(self) -> list:
         return []
 
+    def new_messages(self) -> list:
+        return []
+
 
 class FakeAgent:
     """Agent stub that yields a deferred approval first, then a final reply."""
@@ -326,6 +343,51 @@ def test_create_auto_agent_has_no_runtime_toolsets(monkeypatch, tmp_path: Path)
     assert 'memory-tools' not in toolset_ids
 
 
+def test_cached_agent_reuses_agent_per_mode_and_model(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    deps = _deps(tmp_path, settings)
+    built: list[str] = []
+
+    def fake_resolve(model_name, settings):
+        built.append(model_name)
+        return TestModel()
+
+    monkeypatch.setattr('friday.agent.core._resolve_model', fake_resolve)
+    monkeypatch.setattr('friday.agent.core.create_mcp_servers', lambda configs: [])
+
+    first = cached_agent(deps, AgentMode.READER)
+    assert cached_agent(deps, AgentMode.READER) is first
+    assert cached_agent(deps, AgentMode.CODE) is not first
+
+    deps.settings = settings.model_copy(update={'default_model': 'test'})
+    assert cached_agent(deps, AgentMode.READER) is not first
+    assert len(built) == 3
+
+
+def test_build_toolsets_reuses_function_toolsets(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    sentinel_toolset = FunctionToolset(id='mcp-sentinel')
+    monkeypatch.setattr('friday.agent.core.create_mcp_servers', lambda configs: [sentinel_toolset])
+
+    first = _build_toolsets(MODE_CONFIGS[AgentMode.CODE], settings)
+    second = _build_toolsets(MODE_CONFIGS[AgentMode.CODE], settings)
+
+    assert len(first) > 1
+    assert all(a is b for a, b in zip(first[:-1], second[:-1], strict=True))
+    assert first[-1] is sentinel_toolset
+
+
+def test_model_settings_cache_tool_definitions_for_anthropic_only() -> None:
+    mode_config = MODE_CONFIGS[AgentMode.READER]
+
+    anthropic_settings = _build_model_settings(mode_config, 'anthropic:claude-sonnet-4-20250514')
+    openai_settings = _build_model_settings(mode_config, 'openai:gpt-4.1')
+
+    assert anthropic_settings is not None
+    assert anthropic_settings.get('anthropic_cache_tool_definitions') is True
+    assert 'anthropic_cache_tool_definitions' not in (openai_settings or {})
+
+
 def test_create_agent_accepts_function_model(monkeypatch, tmp_path: Path) -> None:
     settings = _settings(tmp_path)
     context = SimpleNamespace(repo_root=tmp_path, render=lambda: 'workspace')
@@ -348,6 +410,62 @@ def test_create_agent_accepts_function_model(monkeypatch, tmp_path: Path) -> Non
     assert agent.model is sentinel_model
 
 
+def test_execute_agent_returns_uncompacted_history(monkeypatch, tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    deps = _deps(tmp_path, settings, mode=AgentMode.READER)
+    seen_prompts: list[list[str]] = []
+
+    def function_model(messages, info):
+        seen_prompts.append(
+            [
+                part.content
+                for message in messages
+                if isinstance(message, ModelRequest)
+                for part in message.parts
+                if isinstance(part, UserPromptPart)
+            ]
+        )
+        return ModelResponse(parts=[ToolCallPart('final_result', {'markdown': 'ok'})])
+
+    monkeypatch.setattr(
+        'friday.agent.core._resolve_model',
+        lambda model_name, settings: FunctionModel(function_model),
+    )
+    monkeypatch.setattr('friday.agent.core.create_mcp_servers', lambda configs: [])
+    agent = create_agent(AgentMode.READER, settings, deps.context)
+    store = JsonSessionStore(tmp_path / 'sessions')
+    modes: list[str] = []
+    write_messages = JsonSessionStore._write_messages
+
+    def record_mode(path, messages, *, mode):
+        modes.append(mode)
+        write_messages(path, messages, mode=mode)
+
+    monkeypatch.setattr(JsonSessionStore, '_write_messages', staticmethod(record_mode))
+
+    prompts = [f'{turn} ' + 'x' * 500 for turn in range(4)]
+    history: list = []
+    for prompt in prompts:
+        executed = asyncio.run(
+            execute_agent(agent, deps=deps, user_prompt=prompt, message_history=history)
+        )
+        assert executed.messages == [*history, *executed.new_messages]
+        history = executed.messages
+        store.save(SessionData(meta=SessionMeta(id='s', created_at='now'), messages=history))
+
+    # The model saw the oldest prompt clipped, but the session keeps it whole.
+    assert seen_prompts[-1][0] != prompts[0]
+    assert modes == ['wb', 'ab', 'ab', 'ab']
+    assert store.load('s').messages == history
+    assert [
+        part.content
+        for message in history
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+        if isinstance(part, UserPromptPart)
+    ] == prompts
+
+
 def test_prepare_turn_loads_relevant_shared_memory(tmp_path: Path) -> None:
     settings = _settings(tmp_path)
     deps = _deps(tmp_path, settings)
@@ -364,6 +482,7 @@ def test_prepare_turn_loads_relevant_shared_memory(tmp_path: Path) -> None:
     assert deps.memory.task == 'Fabio'
     assert deps.shared_memory.records
     assert 'Fabio' in deps.shared_memory.render()
+    assert deps.shared_memory.render() is deps.shared_memory.render()
     assert any('Fabio' in entity for entity in deps.memory.entities)
 
 
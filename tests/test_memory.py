@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -9,7 +10,7 @@ from friday.agent.deps import AgentDeps
 from friday.agent.memory import load_relevant_shared_memory, record_completed_turn
 from friday.domain.models import AgentMode, MemoryKind, MemoryScope
 from friday.infra.config import FridaySettings
-from friday.infra.memory import SQLiteMemoryStore
+from friday.infra.memory import SQLiteMemoryStore, _fts_escape_token, _recency_boost
 
 
 def _settings(tmp_path: Path) -> FridaySettings:
@@ -144,3 +145,26 @@ def test_sticky_profile_memory_is_injected_cross_session(tmp_path: Path) -> None
 
     assert snapshot.records
     assert any('Fabio' in record.snippet for record in snapshot.records)
+
+
+def test_memory_store_sets_up_schema_once_per_path(monkeypatch, tmp_path: Path) -> None:
+    path = tmp_path / 'nested' / 'memory.db'
+    SQLiteMemoryStore(path).list_memories(workspace_key='ws')
+    calls: list[Path] = []
+    monkeypatch.setattr(SQLiteMemoryStore, '_ensure_schema', lambda self, conn: calls.append(path))
+
+    assert SQLiteMemoryStore(path).list_memories(workspace_key='ws') == []
+    assert calls == []
+
+
+def test_fts_escape_token_strips_operators_and_doubles_quotes() -> None:
+    assert _fts_escape_token('a"b(c)*d:e^f+g ') == 'a""bcdefg'
+
+
+def test_recency_boost_decays_and_ignores_bad_timestamps() -> None:
+    now = datetime(2026, 4, 10, tzinfo=UTC)
+
+    assert _recency_boost('2026-04-10T00:00:00+00:00', now) == 0.3
+    assert _recency_boost('2026-04-05T00:00:00+00:00', now) == 0.3 - 5 * 0.01
+    assert _recency_boost('2025-01-01T00:00:00+00:00', now) == 0.0
+    assert _recency_boost('not a date', now) == 0.0
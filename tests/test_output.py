@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
+
+from pydantic_ai.messages import ToolCallPart
 from rich.panel import Panel
 
-from friday.cli.output import build_response_panel
+from friday.cli.confirm import confirm_action, confirm_deferred_tool
+from friday.cli.output import build_response_panel, console
 
 
 def test_build_response_panel_uses_dedicated_background_style() -> None:
@@ -13,3 +17,44 @@ def test_build_response_panel_uses_dedicated_background_style() -> None:
     assert isinstance(panel, Panel)
     assert panel.style == 'response'
     assert panel.border_style == 'response.border'
+
+
+def test_confirm_action_renders_detail_literally(monkeypatch) -> None:
+    monkeypatch.setattr('sys.stdin.isatty', lambda: False)
+
+    with console.capture() as capture:
+        approved = confirm_action('Confirm', 'run tool', detail='{"text": "[bold]hi[/bold]"}')
+
+    assert approved is False
+    assert '[bold]hi[/bold]' in capture.get()
+
+
+def test_confirm_deferred_tool_clips_long_argument_values(monkeypatch) -> None:
+    monkeypatch.setattr('sys.stdin.isatty', lambda: False)
+    call = ToolCallPart('write_file', {'path': 'big.txt', 'content': 'x' * 50_000})
+
+    with console.capture() as capture:
+        confirm_deferred_tool(call)
+
+    output = capture.get()
+    assert 'big.txt' in output
+    assert 'truncated 48000 chars' in output
+    assert 'content shortened for display' in output
+
+
+def test_confirm_deferred_tool_never_clips_executed_arguments(monkeypatch) -> None:
+    details: list[str] = []
+    monkeypatch.setattr(
+        'friday.cli.confirm.confirm_action',
+        lambda title, description, detail='': details.append(detail) or False,
+    )
+    command = 'echo ' + 'a' * 2100 + ' ; rm -rf ~/important'
+    old = 'o' * 3000
+    new = 'n' * 3000
+
+    confirm_deferred_tool(ToolCallPart('run_shell', {'command': command}))
+    confirm_deferred_tool(ToolCallPart('patch_file', {'path': 'a.py', 'old': old, 'new': new}))
+
+    assert json.loads(details[0])['command'] == command
+    assert json.loads(details[1]) == {'path': 'a.py', 'old': old, 'new': new}
+    assert 'truncated' not in ''.join(details)
@@ -0,0 +1,21 @@
+"""Tests for the interactive picker's search filtering."""
+
+from __future__ import annotations
+
+from friday.cli.picker import InteractivePicker
+
+
+def _filter(picker: InteractivePicker, query: str) -> list[str]:
+    picker.query = query
+    picker._apply_filter()
+    return picker.filtered
+
+
+def test_filter_narrows_and_widens_case_insensitively() -> None:
+    picker = InteractivePicker(['Alpha', 'beta', 'alphabet', 'Gamma'], max_visible=5)
+
+    assert _filter(picker, 'a') == ['Alpha', 'beta', 'alphabet', 'Gamma']
+    assert _filter(picker, 'alp') == ['Alpha', 'alphabet']
+    assert _filter(picker, 'alpha') == ['Alpha', 'alphabet']
+    assert _filter(picker, 'b') == ['beta', 'alphabet']
+    assert _filter(picker, '') == ['Alpha', 'beta', 'alphabet', 'Gamma']
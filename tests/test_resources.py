@@ -42,3 +42,18 @@ def test_interactive_session_pick_requires_tty(monkeypatch, tmp_path) -> None:
 
     assert selected is None
     assert errors == ['Select session requires an interactive terminal.']
+
+
+def test_pick_id_maps_selected_label_back_to_id(monkeypatch) -> None:
+    calls: list[tuple[list[str], str]] = []
+
+    def _pick(items: list[str], *, current: str, title: str) -> str:
+        calls.append((items, current))
+        return items[1]
+
+    monkeypatch.setattr(resources_module, '_interactive_pick', _pick)
+
+    selected = resources_module._pick_id({'a  first': 'a', 'b  second': 'b'}, current='a', title='')
+
+    assert selected == 'b'
+    assert calls == [(['a  first', 'b  second'], 'a  first')]
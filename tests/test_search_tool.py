@@ -32,6 +32,14 @@ class TestSearch:
         result = asyncio.run(search(ctx, 'hello'))
         assert 'hello' in result
 
+    def test_falls_back_to_grep_without_ripgrep(self, monkeypatch, tmp_workspace: Path) -> None:
+        from friday.tools import filesystem
+
+        monkeypatch.setattr(filesystem, '_has_ripgrep', lambda: False)
+        ctx = _make_ctx(tmp_workspace)
+        result = asyncio.run(filesystem.search(ctx, 'hello'))
+        assert 'hello' in result
+
     def test_no_matches(self, tmp_workspace: Path) -> None:
         from friday.tools.filesystem import search
 
@@ -0,0 +1,135 @@
+"""Tests for JSON session persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from friday.infra.sessions import (
+    JsonSessionStore,
+    SessionData,
+    SessionMeta,
+    extract_last_user_message,
+    extract_turn_count,
+)
+
+
+def _meta(session_id: str = 'session-1') -> SessionMeta:
+    return SessionMeta(id=session_id, created_at='2026-04-09T12:00:00')
+
+
+def _turn(prompt: str, answer: str) -> list:
+    return [
+        ModelRequest(parts=[UserPromptPart(prompt)]),
+        ModelResponse(parts=[TextPart(answer)]),
+    ]
+
+
+def test_save_appends_only_new_messages(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    messages = _turn('hi', 'hello')
+    store.save(SessionData(meta=_meta(), messages=messages))
+    messages = [*messages, *_turn('again', 'sure')]
+    store.save(SessionData(meta=_meta(), messages=messages))
+
+    lines = (tmp_path / 'session-1.messages.jsonl').read_text().splitlines()
+    loaded = JsonSessionStore(tmp_path).load('session-1')
+
+    assert len(lines) == 4
+    assert loaded.messages == messages
+
+
+def test_iter_messages_streams_saved_log(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    messages = _turn('hi', 'hello')
+    store.save(SessionData(meta=_meta(), messages=messages))
+
+    assert list(store.iter_messages('session-1')) == messages
+    assert list(store.iter_messages('missing')) == []
+
+
+def test_save_rewrites_when_history_was_compacted(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    store.save(SessionData(meta=_meta(), messages=[*_turn('hi', 'hello'), *_turn('a', 'b')]))
+    compacted = _turn('a', 'b')
+    store.save(SessionData(meta=_meta(), messages=compacted))
+
+    assert store.load('session-1').messages == compacted
+
+
+def test_load_reads_legacy_inline_messages(tmp_path: Path) -> None:
+    (tmp_path / 'old.json').write_text(
+        json.dumps(
+            {
+                'schema_version': 2,
+                'meta': _meta('old').model_dump(),
+                'messages': [
+                    {
+                        'kind': 'request',
+                        'parts': [{'part_kind': 'user-prompt', 'content': 'legacy'}],
+                    }
+                ],
+            }
+        )
+    )
+
+    loaded = JsonSessionStore(tmp_path).load('old')
+
+    assert loaded.messages[0].parts[0].content == 'legacy'
+
+
+def test_delete_removes_message_log(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    store.save(SessionData(meta=_meta(), messages=_turn('hi', 'hello')))
+
+    assert store.delete('session-1') is True
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_list_sessions_returns_newest_first(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    for index, session_id in enumerate(['a', 'b', 'c']):
+        store.save(SessionData(meta=_meta(session_id)))
+        os.utime(tmp_path / f'{session_id}.json', (1_000 + index, 1_000 + index))
+
+    assert [meta.id for meta in store.list_sessions(limit=2)] == ['c', 'b']
+    assert store.latest_id() == 'c'
+
+
+def test_extract_meta_ignores_tool_return_requests() -> None:
+    messages = [
+        *_turn('first', 'ok'),
+        *_turn('second question', 'ok'),
+        ModelRequest(parts=[ToolReturnPart('read_file', 'contents', 'call-1')]),
+    ]
+
+    assert extract_turn_count(messages) == 2
+    assert extract_last_user_message(messages) == 'second question'
+
+
+def test_save_skips_writes_when_nothing_changed(tmp_path: Path) -> None:
+    store = JsonSessionStore(tmp_path)
+    data = SessionData(meta=_meta(), messages=_turn('hi', 'hello'))
+    store.save(data)
+    meta_path = tmp_path / 'session-1.json'
+    os.utime(meta_path, (1_000, 1_000))
+    os.utime(tmp_path / 'session-1.messages.jsonl', (1_000, 1_000))
+
+    store.save(data)
+
+    assert meta_path.stat().st_mtime == 1_000
+    assert (tmp_path / 'session-1.messages.jsonl').stat().st_mtime == 1_000
+
+    changed = _meta().model_copy(update={'mode': 'code'})
+    store.save(SessionData(meta=changed, messages=data.messages))
+
+    assert meta_path.stat().st_mtime != 1_000
@@ -55,6 +55,26 @@ class TestReadFile:
         with pytest.raises(PermissionError):
             asyncio.run(read_file(ctx, '../../../etc/passwd'))
 
+    def test_sees_changes_after_write(self, tmp_workspace: Path) -> None:
+        from friday.tools.filesystem import read_file, write_file
+
+        ctx = _make_ctx(tmp_workspace)
+        assert 'print("hello")' in asyncio.run(read_file(ctx, 'hello.py'))
+        asyncio.run(write_file(ctx, 'hello.py', 'changed\n'))
+        result = asyncio.run(read_file(ctx, 'hello.py'))
+        assert 'changed' in result
+        assert 'hello' not in result
+
+    def test_large_files_bypass_cache(self, monkeypatch, tmp_workspace: Path) -> None:
+        from friday.tools import filesystem
+
+        monkeypatch.setattr(filesystem, '_READ_CACHE_MAX_BYTES', 4)
+        filesystem._cached_lines.cache_clear()
+        ctx = _make_ctx(tmp_workspace)
+        asyncio.run(filesystem.read_file(ctx, 'hello.py'))
+
+        assert filesystem._cached_lines.cache_info().currsize == 0
+
 
 class TestWriteFile:
     def test_creates_file(self, tmp_workspace: Path) -> None:
@@ -97,3 +117,15 @@ class TestListFiles:
         ctx = _make_ctx(tmp_workspace)
         result = asyncio.run(list_files(ctx))
         assert 'hello.py' in result
+
+    def test_truncates_sorted_matches(self, tmp_path: Path) -> None:
+        from friday.tools.filesystem import list_files
+
+        for index in range(105):
+            (tmp_path / f'f{index:03}.txt').write_text('')
+        ctx = _make_ctx(tmp_path)
+        lines = asyncio.run(list_files(ctx)).splitlines()
+
+        assert lines[:2] == ['f000.txt', 'f001.txt']
+        assert lines[99] == 'f099.txt'
+        assert lines[100] == '...[5 more]'